@@ -12,13 +12,17 @@ References:
 from __future__ import annotations
 
 import logging
-import re
 from typing import TYPE_CHECKING
 
-from src.tags import is_rc_tag
+from github.GithubException import GithubException
+
+from src.branch import is_plain_number
+from src.tags import create_patch_pattern, is_rc_tag
 
 if TYPE_CHECKING:
-    from src.github_api import GitHubAPI
+    from collections.abc import Iterable
+
+    from src.github_api import GitHubAPI, TagRef
 
 logger = logging.getLogger(__name__)
 
@@ -34,19 +38,6 @@ __all__ = [
 ]
 
 
-def _create_patch_pattern(tag_prefix: str) -> re.Pattern[str]:
-    """Create regex pattern for GA/patch tags with given prefix.
-
-    Args:
-        tag_prefix: The prefix for tags (e.g., 'v', 'pkg-v').
-
-    Returns:
-        Compiled regex pattern matching {prefix}X.Y.Z.
-    """
-    escaped_prefix = re.escape(tag_prefix)
-    return re.compile(f"^{escaped_prefix}(\\d+)\\.(\\d+)\\.(\\d+)$")
-
-
 def parse_release_tag(tag_name: str, tag_prefix: str = "v") -> tuple[int, int, int] | None:
     """Parse a release tag into (major, minor, patch) components.
 
@@ -63,13 +54,64 @@ def parse_release_tag(tag_name: str, tag_prefix: str = "v") -> tuple[int, int, i
         >>> parse_release_tag("v1.2.0-rc1")
         None
     """
-    pattern = _create_patch_pattern(tag_prefix)
-    match = pattern.match(tag_name)
+    if not tag_name.startswith(tag_prefix):
+        return None
+
+    # Fast path: plain X.Y.Z with canonical numbers needs no regex
+    parts = tag_name[len(tag_prefix) :].split(".")
+    if len(parts) == 3 and all(is_plain_number(part) for part in parts):
+        return int(parts[0]), int(parts[1]), int(parts[2])
+
+    pattern = create_patch_pattern(tag_prefix)
+    match = pattern.fullmatch(tag_name)
     if match:
         return int(match.group(1)), int(match.group(2)), int(match.group(3))
     return None
 
 
+def _build_version_index(
+    tag_names: Iterable[str], tag_prefix: str = "v"
+) -> tuple[dict[int, tuple[int, int, int]], dict[tuple[int, int], tuple[int, int, int]]]:
+    """Index the highest release per major and per (major, minor) series.
+
+    Builds both maps in a single pass over the tag names so that any number of
+    alias lookups against the same tag list are dictionary lookups.
+
+    Args:
+        tag_names: Tag names to index.
+        tag_prefix: The tag prefix to match (default: 'v').
+
+    Returns:
+        Tuple of (highest release per major, highest release per (major, minor)),
+        where each release is a (major, minor, patch) tuple.
+
+    Examples:
+        >>> by_major, by_minor = _build_version_index(["v1.2.0", "v1.2.3", "v1.3.0"])
+        >>> by_major[1]
+        (1, 3, 0)
+        >>> by_minor[(1, 2)]
+        (1, 2, 3)
+    """
+    by_major: dict[int, tuple[int, int, int]] = {}
+    by_minor: dict[tuple[int, int], tuple[int, int, int]] = {}
+
+    for tag_name in tag_names:
+        parsed = parse_release_tag(tag_name, tag_prefix)
+        if parsed is None:
+            continue
+
+        highest_major = by_major.get(parsed[0])
+        if highest_major is None or parsed > highest_major:
+            by_major[parsed[0]] = parsed
+
+        series = (parsed[0], parsed[1])
+        highest_minor = by_minor.get(series)
+        if highest_minor is None or parsed > highest_minor:
+            by_minor[series] = parsed
+
+    return by_major, by_minor
+
+
 def find_highest_major_version(api: GitHubAPI, major: int, tag_prefix: str = "v") -> tuple[int, int, int] | None:
     """Find the highest {prefix}X.*.* release across all branches for a given major version.
 
@@ -89,26 +131,8 @@ def find_highest_major_version(api: GitHubAPI, major: int, tag_prefix: str = "v"
     References:
         - Requirements 6.1, 7.3
     """
-    tags = api.list_tags()
-    highest: tuple[int, int, int] | None = None
-
-    for tag in tags:
-        parsed = parse_release_tag(tag.name, tag_prefix)
-        if parsed is None:
-            continue
-
-        tag_major, tag_minor, tag_patch = parsed
-        if tag_major != major:
-            continue
-
-        if highest is None:
-            highest = parsed
-        else:
-            # Compare (minor, patch) tuples
-            if (tag_minor, tag_patch) > (highest[1], highest[2]):
-                highest = parsed
-
-    return highest
+    by_major, _ = _build_version_index(api.list_tag_refs(f"{tag_prefix}{major}."), tag_prefix)
+    return by_major.get(major)
 
 
 def find_highest_minor_version(
@@ -133,22 +157,8 @@ def find_highest_minor_version(
     References:
         - Requirements 6.2, 7.2
     """
-    tags = api.list_tags()
-    highest: tuple[int, int, int] | None = None
-
-    for tag in tags:
-        parsed = parse_release_tag(tag.name, tag_prefix)
-        if parsed is None:
-            continue
-
-        tag_major, tag_minor, tag_patch = parsed
-        if tag_major != major or tag_minor != minor:
-            continue
-
-        if highest is None or tag_patch > highest[2]:
-            highest = parsed
-
-    return highest
+    _, by_minor = _build_version_index(api.list_tag_refs(f"{tag_prefix}{major}.{minor}."), tag_prefix)
+    return by_minor.get((major, minor))
 
 
 def update_alias_tags(
@@ -157,11 +167,13 @@ def update_alias_tags(
     commit_sha: str,
     tag_prefix: str = "v",
     skip_minor_alias: bool = False,
+    is_latest_patch: bool = False,
+    tags: Iterable[TagRef] | None = None,
 ) -> dict[str, bool]:
     """Update major ({prefix}X) and minor ({prefix}X.Y) alias tags for a release.
 
-    Skips alias updates for RC releases. Uses force-push to update
-    movable alias tags.
+    Skips alias updates for RC releases. Uses force-push to update movable
+    alias tags.
 
     Args:
         api: GitHubAPI instance for tag operations.
@@ -170,6 +182,12 @@ def update_alias_tags(
         tag_prefix: The tag prefix to use for aliases (default: 'v').
         skip_minor_alias: If True, skip creating the minor alias to avoid
             branch/tag conflict when release_prefix == tag_prefix.
+        is_latest_patch: If True, the caller guarantees the release is the
+            highest patch of its minor series (e.g. it was just computed as
+            the next patch), so only the major alias needs the tag scan.
+        tags: Tag listing already fetched by the caller, including the
+            release itself; defaults to listing the major series' tags
+            through the API.
 
     Returns:
         Dict with 'major' and 'minor' keys indicating if each alias was updated.
@@ -195,34 +213,39 @@ def update_alias_tags(
         logger.warning("Cannot parse release tag '%s', skipping alias updates", tag_name)
         return result
 
-    major, minor, patch = parsed
+    major, minor, _ = parsed
+
+    # Fetch only this major series' tags once and decide both aliases in one pass
+    check_minor = not skip_minor_alias and not is_latest_patch
+    series_prefix = f"{tag_prefix}{major}."
+    if tags is None:
+        series_tags = api.list_tag_refs(series_prefix)
+    else:
+        series_tags = [tag.name for tag in tags if tag.name.startswith(series_prefix)]
+    update_minor, update_major = _scan_alias_targets(series_tags, parsed, tag_prefix, check_minor=check_minor)
+    update_minor = update_minor or is_latest_patch
 
     # Update minor alias ({prefix}X.Y) if this is the highest patch in the series
     # Skip if skip_minor_alias is True (to avoid branch/tag conflict)
-    if not skip_minor_alias:
-        minor_alias = f"{tag_prefix}{major}.{minor}"
-        highest_minor = find_highest_minor_version(api, major, minor, tag_prefix)
-
-        if highest_minor is not None and (major, minor, patch) >= highest_minor:
-            _update_or_create_alias(api, minor_alias, commit_sha)
-            result["minor"] = True
-            logger.info("Updated minor alias '%s' to point to '%s'", minor_alias, tag_name)
-    else:
+    if skip_minor_alias:
         logger.info(
             "Skipping minor alias '%s%d.%d' to avoid conflict with release branch",
             tag_prefix,
             major,
             minor,
         )
+    elif update_minor:
+        minor_alias = f"{tag_prefix}{major}.{minor}"
+        _update_or_create_alias(api, minor_alias, commit_sha)
+        logger.info("Updated alias '%s' to point to '%s'", minor_alias, tag_name)
+        result["minor"] = True
 
     # Update major alias ({prefix}X) if this is the highest release in the major series
-    major_alias = f"{tag_prefix}{major}"
-    highest_major = find_highest_major_version(api, major, tag_prefix)
-
-    if highest_major is not None and (major, minor, patch) >= highest_major:
+    if update_major:
+        major_alias = f"{tag_prefix}{major}"
         _update_or_create_alias(api, major_alias, commit_sha)
+        logger.info("Updated alias '%s' to point to '%s'", major_alias, tag_name)
         result["major"] = True
-        logger.info("Updated major alias '%s' to point to '%s'", major_alias, tag_name)
 
     return result
 
@@ -230,22 +253,79 @@ def update_alias_tags(
 def _update_or_create_alias(api: GitHubAPI, alias_name: str, commit_sha: str) -> None:
     """Update an existing alias tag or create it if it doesn't exist.
 
+    Aliases usually exist already, so the force-update is tried first and
+    the tag is only created when GitHub reports the ref missing.
+
     Args:
         api: GitHubAPI instance for tag operations.
         alias_name: Name of the alias tag (e.g., 'v1' or 'v1.2').
         commit_sha: SHA of the commit to point to.
 
+    Raises:
+        GithubException: If the update fails for any reason other than a
+            missing ref, or if creating the tag fails.
+
     References:
         - Requirements 6.3
     """
-    if api.tag_exists(alias_name):
+    try:
         logger.debug("Force-updating alias tag '%s'", alias_name)
         api.update_tag(alias_name, commit_sha)
-    else:
+    except GithubException as e:
+        # Updating a missing ref is rejected with 422 (or 404)
+        if e.status not in (404, 422):
+            raise
         logger.debug("Creating new alias tag '%s'", alias_name)
         api.create_tag(alias_name, commit_sha, f"Alias tag {alias_name}")
 
 
+def _scan_alias_targets(
+    tag_names: Iterable[str],
+    release: tuple[int, int, int],
+    tag_prefix: str,
+    check_minor: bool = True,
+) -> tuple[bool, bool]:
+    """Decide whether a release should move its minor and major aliases.
+
+    A release moves an alias when the series has at least one release and
+    none of them is higher than it. The scan stops as soon as a higher release
+    rules out every alias still being checked, so a stale release on a busy
+    series rarely reads the whole listing.
+
+    Args:
+        tag_names: Tag names to scan.
+        release: The (major, minor, patch) of the release being published.
+        tag_prefix: The tag prefix to match.
+        check_minor: If False, only the major alias decides when to stop.
+
+    Returns:
+        Tuple of (update minor alias, update major alias).
+    """
+    major, minor, patch = release
+    seen_major = seen_minor = False
+    higher_major = higher_minor = False
+
+    for tag_name in tag_names:
+        parsed = parse_release_tag(tag_name, tag_prefix)
+        if parsed is None:
+            continue
+        tag_major, tag_minor, tag_patch = parsed
+        if tag_major != major:
+            continue
+
+        seen_major = True
+        same_minor = tag_minor == minor
+        seen_minor = seen_minor or same_minor
+        # Compare scalars directly rather than building tuples per tag
+        if tag_minor > minor or (same_minor and tag_patch > patch):
+            higher_major = True
+            higher_minor = higher_minor or same_minor
+            if higher_minor or not check_minor:
+                break
+
+    return seen_minor and not higher_minor, seen_major and not higher_major
+
+
 def should_update_major_alias(
     api: GitHubAPI,
     major: int,
@@ -10,6 +10,7 @@ References:
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -18,12 +19,19 @@ logger = logging.getLogger(__name__)
 
 # SemVer 2.0.0 compliant pattern: no leading zeros allowed
 # Pattern: release/vX.Y where X and Y are non-negative integers without leading zeros
-RELEASE_BRANCH_PATTERN = re.compile(r"^release/v(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)$")
+RELEASE_BRANCH_PATTERN = re.compile(r"^release/v(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)$", re.ASCII)
+
+# Literal prefix of the default release branch shape, checked without regex
+_RELEASE_BRANCH_PREFIX = "release/v"
 
 # Characters invalid in git refs (branch names and tags)
 # See: https://git-scm.com/docs/git-check-ref-format
 INVALID_PREFIX_CHARS = ["..", "~", "^", ":", "\\", " ", "\t", "\n", "*", "?", "["]
 
+# Translation table deleting every single-character entry, so a prefix can be
+# checked in one C-level pass; '..' is the only multi-character sequence
+_INVALID_PREFIX_TABLE = dict.fromkeys(ord(char) for char in INVALID_PREFIX_CHARS if len(char) == 1)
+
 
 def validate_prefix(prefix: str) -> bool:
     """Validate that a prefix is valid for git branch names and tags.
@@ -57,16 +65,19 @@ def validate_prefix(prefix: str) -> bool:
         logger.warning("Empty prefix provided")
         return False
 
-    for invalid_char in INVALID_PREFIX_CHARS:
-        if invalid_char in prefix:
-            logger.warning(
-                "Prefix '%s' contains invalid character '%s'",
-                prefix,
-                repr(invalid_char),
-            )
-            return False
+    if ".." in prefix:
+        invalid_char = ".."
+    elif len(prefix.translate(_INVALID_PREFIX_TABLE)) != len(prefix):
+        invalid_char = next(char for char in prefix if ord(char) in _INVALID_PREFIX_TABLE)
+    else:
+        return True
 
-    return True
+    logger.warning(
+        "Prefix '%s' contains invalid character '%s'",
+        prefix,
+        repr(invalid_char),
+    )
+    return False
 
 
 def create_branch_pattern(release_prefix: str) -> re.Pattern[str]:
@@ -98,12 +109,15 @@ def create_branch_pattern(release_prefix: str) -> re.Pattern[str]:
     """
     escaped_prefix = re.escape(release_prefix)
     pattern = f"^{escaped_prefix}(0|[1-9][0-9]*)\\.(0|[1-9][0-9]*)$"
-    return re.compile(pattern)
+    return re.compile(pattern, re.ASCII)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BranchVersion:
-    """Version information extracted from a release branch name."""
+    """Version information extracted from a release branch name.
+
+    Instances are immutable so the cached parsers can share them safely.
+    """
 
     major: int
     minor: int
@@ -113,11 +127,44 @@ class BranchVersion:
         return f"{self.major}.{self.minor}"
 
 
+def is_plain_number(part: str) -> bool:
+    """Check if a version component is an ASCII integer without leading zeros.
+
+    Args:
+        part: The version component to check (e.g., '12').
+
+    Returns:
+        True if the component is '0' or an ASCII digit string not starting with '0'.
+    """
+    return part.isascii() and part.isdigit() and (part == "0" or part[0] != "0")
+
+
+def _fast_parse_release_branch(branch_name: str) -> tuple[int, int] | None:
+    """Parse a release/vX.Y branch name with string operations instead of regex.
+
+    Accepts exactly the branches matched by RELEASE_BRANCH_PATTERN.
+
+    Args:
+        branch_name: The branch name to parse (e.g., 'release/v1.2').
+
+    Returns:
+        Tuple of (major, minor), or None if the branch does not match.
+    """
+    if not branch_name.startswith(_RELEASE_BRANCH_PREFIX):
+        return None
+
+    parts = branch_name[len(_RELEASE_BRANCH_PREFIX) :].split(".")
+    if len(parts) != 2 or not is_plain_number(parts[0]) or not is_plain_number(parts[1]):
+        return None
+    return int(parts[0]), int(parts[1])
+
+
 def validate_branch(branch_name: str) -> bool:
     """Validate that a branch name matches the release/vX.Y pattern.
 
     The pattern enforces SemVer 2.0.0 rule 2: version numbers MUST NOT
-    contain leading zeroes (except for 0 itself).
+    contain leading zeroes (except for 0 itself). Delegates to the cached
+    extract_version, so validating and then extracting parses only once.
 
     Args:
         branch_name: The branch name to validate (e.g., 'release/v1.2').
@@ -138,24 +185,16 @@ def validate_branch(branch_name: str) -> bool:
     References:
         - SemVer 2.0.0 Rule 2: https://semver.org/#spec-item-2
     """
-    if not branch_name:
-        logger.warning("Empty branch name provided")
-        return False
-
-    match = RELEASE_BRANCH_PATTERN.match(branch_name)
-    if match:
-        return True
-
-    logger.warning(
-        "Branch '%s' does not match release/vX.Y pattern. Skipping.",
-        branch_name,
-    )
-    return False
+    return extract_version(branch_name) is not None
 
 
+@functools.lru_cache(maxsize=256)
 def extract_version(branch_name: str) -> BranchVersion | None:
     """Extract major and minor version numbers from a release branch name.
 
+    Results are cached by branch name, so a rejected branch is only logged
+    the first time it is seen.
+
     Args:
         branch_name: The branch name to extract version from (e.g., 'release/v1.2').
 
@@ -175,28 +214,28 @@ def extract_version(branch_name: str) -> BranchVersion | None:
         - Requirements 1.1, 1.2, 1.3
     """
     if not branch_name:
-        logger.warning("Empty branch name provided")
+        logger.debug("Empty branch name provided")
         return None
 
-    match = RELEASE_BRANCH_PATTERN.match(branch_name)
-    if not match:
-        logger.warning(
+    parsed = _fast_parse_release_branch(branch_name)
+    if parsed is None:
+        logger.debug(
             "Cannot extract version from '%s': does not match release/vX.Y pattern",
             branch_name,
         )
         return None
 
-    major = int(match.group(1))
-    minor = int(match.group(2))
-
+    major, minor = parsed
     return BranchVersion(major=major, minor=minor)
 
 
+@functools.lru_cache(maxsize=256)
 def parse_branch(branch_name: str, release_prefix: str = "release/v") -> BranchVersion | None:
     """Parse a branch name and extract version information using configurable prefix.
 
     This function validates the branch name against the configured release prefix
-    pattern and extracts the major and minor version numbers.
+    pattern and extracts the major and minor version numbers. Results are
+    cached by (branch_name, release_prefix).
 
     Args:
         branch_name: The branch name to parse (e.g., 'release/v1.2', 'v1.2', 'pkg-1.2').
@@ -223,14 +262,14 @@ def parse_branch(branch_name: str, release_prefix: str = "release/v") -> BranchV
         - Requirements 3.1, 3.5, 4.1
     """
     if not branch_name:
-        logger.warning("Empty branch name provided")
+        logger.debug("Empty branch name provided")
         return None
 
     pattern = create_branch_pattern(release_prefix)
-    match = pattern.match(branch_name)
+    match = pattern.fullmatch(branch_name)
 
     if not match:
-        logger.warning(
+        logger.debug(
             "Branch '%s' does not match %sX.Y pattern. Skipping.",
             branch_name,
             release_prefix,
@@ -3,20 +3,51 @@
 
 References:
     - GitHub REST API: https://docs.github.com/en/rest
+    - GitHub GraphQL API: https://docs.github.com/en/graphql
     - PyGithub Documentation: https://pygithub.readthedocs.io/
 """
 
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
-from github import Github
+from github import Auth, Github
 from github.GithubException import GithubException
 
 if TYPE_CHECKING:
-    from github.Commit import Commit
-    from github.Tag import Tag
+    from collections.abc import Iterator
+
+    from github.Repository import Repository
+
+_LIST_TAGS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/tags/", first: 100, after: $cursor) {
+      nodes {
+        name
+        target {
+          __typename
+          oid
+          ... on Tag { target { __typename oid } }
+        }
+      }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class TagRef:
+    """A repository tag and the commit it points to."""
+
+    name: str
+    commit_sha: str
 
 
 class GitHubAPI:
@@ -33,12 +64,11 @@ class GitHubAPI:
     def __init__(self, token: str | None = None, repository: str | None = None) -> None:
         """Initialize the GitHub API client.
 
+        Construction makes no requests; the repository is fetched on first use.
+
         Args:
             token: GitHub token for authentication. Defaults to GITHUB_TOKEN env var.
             repository: Repository in 'owner/repo' format. Defaults to GITHUB_REPOSITORY env var.
-
-        References:
-            - Get a repository: https://docs.github.com/en/rest/repos/repos#get-a-repository
         """
         self._token = token or os.environ.get("GITHUB_TOKEN", "")
         self._repository = repository or os.environ.get("GITHUB_REPOSITORY", "")
@@ -48,19 +78,149 @@ class GitHubAPI:
         if not self._repository:
             raise ValueError("Repository is required. Set GITHUB_REPOSITORY or pass repository parameter.")
 
-        self._github = Github(self._token)
-        self._repo = self._github.get_repo(self._repository)
+        # Request the API maximum of 100 items per page for every paginated
+        # listing. The client is lazy: objects built from a URL are only
+        # fetched when an attribute that needs the API is first read.
+        self._github = Github(auth=Auth.Token(self._token), per_page=100, lazy=True)
+        # Tags from the last complete listing and their name index; cleared
+        # whenever a tag changes
+        self._tags_cache: list[TagRef] | None = None
+        self._tag_commits: dict[str, str] | None = None
+
+    @cached_property
+    def _repo(self) -> Repository:
+        """The repository handle, built without fetching the repository.
+
+        REST calls only need the repository URL, so the lazy client skips the
+        GET /repos/{owner}/{repo} round trip.
 
-    def list_tags(self) -> list[Tag]:
+        References:
+            - Get a repository: https://docs.github.com/en/rest/repos/repos#get-a-repository
+        """
+        return self._github.get_repo(self._repository)
+
+    def list_tags(self) -> list[TagRef]:
         """List all tags in the repository.
 
+        The listing is fetched once and reused until a tag is created or
+        moved through this instance.
+
+        Returns:
+            List of TagRef records from the repository.
+
+        References:
+            - Repository refs: https://docs.github.com/en/graphql/reference/objects#repository
+        """
+        return list(self.iter_tags())
+
+    def iter_tags(self) -> Iterator[TagRef]:
+        """Iterate over the repository's tags one page at a time.
+
+        Each GraphQL page carries the tag names and their commit SHAs, with
+        annotated tags already dereferenced, so no per-tag requests follow.
+        Pages are fetched lazily, so a scan that stops early never requests
+        the remaining pages. A scan that reaches the end caches the listing,
+        and later scans are served from it without any API calls.
+
+        Yields:
+            TagRef records from the repository.
+
+        References:
+            - Repository refs: https://docs.github.com/en/graphql/reference/objects#repository
+        """
+        if self._tags_cache is not None:
+            yield from self._tags_cache
+            return
+
+        cursor = None
+        fetched: list[TagRef] = []
+        while True:
+            refs = self._list_tags_page(cursor)
+            for node in refs["nodes"]:
+                tag = TagRef(name=node["name"], commit_sha=self._peel_target(node["target"]))
+                fetched.append(tag)
+                yield tag
+            if not refs["pageInfo"]["hasNextPage"]:
+                break
+            cursor = refs["pageInfo"]["endCursor"]
+        self._tags_cache = fetched
+
+    def _list_tags_page(self, cursor: str | None) -> dict[str, Any]:
+        """Fetch one page of tag refs through GraphQL.
+
+        Args:
+            cursor: Cursor returned by the previous page, or None for the first.
+
+        Returns:
+            The refs connection, with 'nodes' and 'pageInfo' entries.
+        """
+        owner, _, name = self._repository.partition("/")
+        _, response = self._github.requester.graphql_query(
+            _LIST_TAGS_QUERY,
+            {"owner": owner, "name": name, "cursor": cursor},
+        )
+        refs: dict[str, Any] = response["data"]["repository"]["refs"]
+        return refs
+
+    def _peel_target(self, target: dict[str, Any]) -> str:
+        """Dereference a listed ref target down to the commit it tags.
+
+        The listing query already resolves one level of annotated tag. A tag
+        of a tag is rare, so any further levels are followed through REST.
+
+        Args:
+            target: The ref node's 'target' entry from the listing query.
+
+        Returns:
+            SHA of the first non-tag object the ref leads to.
+
+        References:
+            - Get a tag: https://docs.github.com/en/rest/git/tags#get-a-tag
+        """
+        # Annotated tags point at a tag object that points at the commit
+        if target["__typename"] == "Tag":
+            target = target["target"]
+        sha: str = target["oid"]
+        if target["__typename"] == "Tag":
+            git_object = self._repo.get_git_tag(sha).object
+            while git_object.type == "tag":
+                git_object = self._repo.get_git_tag(git_object.sha).object
+            sha = git_object.sha
+        return sha
+
+    def refresh_tags(self) -> None:
+        """Discard the cached tag listing so the next scan refetches it."""
+        self._tags_cache = None
+        self._tag_commits = None
+
+    def _cached_tag_commits(self) -> dict[str, str] | None:
+        """Map tag names to commit SHAs from the cached listing.
+
         Returns:
-            List of Tag objects from the repository.
+            Dict of tag name to commit SHA, or None if no listing is cached.
+        """
+        if self._tags_cache is None:
+            return None
+        if self._tag_commits is None:
+            self._tag_commits = {tag.name: tag.commit_sha for tag in self._tags_cache}
+        return self._tag_commits
+
+    def list_tag_refs(self, prefix: str) -> list[str]:
+        """List tag names starting with a prefix, filtered server-side.
+
+        Uses the matching-refs endpoint so only tags under the prefix are
+        transferred, instead of paging through every tag in the repository.
+
+        Args:
+            prefix: Tag name prefix to match (e.g., 'v1.').
+
+        Returns:
+            List of tag names (without the 'refs/tags/' prefix).
 
         References:
-            - List repository tags: https://docs.github.com/en/rest/repos/repos#list-repository-tags
+            - List matching references: https://docs.github.com/en/rest/git/refs#list-matching-references
         """
-        return list(self._repo.get_tags())
+        return [ref.ref.removeprefix("refs/tags/") for ref in self._repo.get_git_matching_refs(f"tags/{prefix}")]
 
     def create_tag(
         self,
@@ -85,18 +245,11 @@ class GitHubAPI:
             - Create a tag object: https://docs.github.com/en/rest/git/tags#create-a-tag-object
             - Create a reference: https://docs.github.com/en/rest/git/refs#create-a-reference
         """
-        # Check if tag already exists (handles workflow reruns gracefully)
-        existing_sha = self.get_tag_commit_sha(tag_name)
-        if existing_sha is not None:
-            if existing_sha == commit_sha:
-                # Tag already exists pointing to same commit - idempotent success
-                return
-            # Tag exists but points to different commit - this is an error
-            raise GithubException(
-                409,
-                {"message": f"Tag '{tag_name}' already exists pointing to different commit {existing_sha[:7]}"},
-                None,
-            )
+        # Check if tag already exists (handles workflow reruns gracefully).
+        # A cached listing answers this without a request, and no orphan tag
+        # object is written for a tag that is already there.
+        if self._tag_already_created(tag_name, commit_sha):
+            return
 
         # Create the tag object (annotated tag)
         tag_object = self._repo.create_git_tag(
@@ -107,9 +260,45 @@ class GitHubAPI:
         )
 
         # Create the reference pointing to the tag object
-        self._repo.create_git_ref(
-            ref=f"refs/tags/{tag_name}",
-            sha=tag_object.sha,
+        try:
+            self._repo.create_git_ref(
+                ref=f"refs/tags/{tag_name}",
+                sha=tag_object.sha,
+            )
+            self.refresh_tags()
+        except GithubException as e:
+            if e.status != 422:
+                raise
+            # The tag appeared after the check (e.g., a concurrent run or a
+            # stale cached listing), so look it up again
+            self.refresh_tags()
+            if not self._tag_already_created(tag_name, commit_sha):
+                raise
+
+    def _tag_already_created(self, tag_name: str, commit_sha: str) -> bool:
+        """Check whether a tag already exists pointing to the given commit.
+
+        Args:
+            tag_name: Name of the tag.
+            commit_sha: SHA of the commit the tag should point to.
+
+        Returns:
+            True if the tag points to commit_sha, False if it doesn't exist.
+
+        Raises:
+            GithubException: If the tag exists pointing to a different commit.
+        """
+        existing_sha = self.get_tag_commit_sha(tag_name)
+        if existing_sha is None:
+            return False
+        if existing_sha == commit_sha:
+            # Tag already exists pointing to same commit - idempotent success
+            return True
+        # Tag exists but points to different commit - this is an error
+        raise GithubException(
+            409,
+            {"message": f"Tag '{tag_name}' already exists pointing to different commit {existing_sha[:7]}"},
+            None,
         )
 
     def update_tag(self, tag_name: str, commit_sha: str) -> None:
@@ -127,57 +316,92 @@ class GitHubAPI:
         References:
             - Update a reference: https://docs.github.com/en/rest/git/refs#update-a-reference
         """
-        ref = self._repo.get_git_ref(f"tags/{tag_name}")
-        ref.edit(sha=commit_sha, force=True)
+        # An unfetched GitRef from the lazy client carries the singular
+        # /git/ref/ lookup URL, so PATCH the documented /git/refs/ endpoint
+        self._github.requester.requestJsonAndCheck(
+            "PATCH",
+            f"{self._repo.url}/git/refs/tags/{quote(tag_name)}",
+            input={"sha": commit_sha, "force": True},
+        )
+        self.refresh_tags()
+
+    def is_ancestor(self, branch_name: str, commit_sha: str) -> bool:
+        """Check whether a commit is reachable from a branch.
 
-    def get_branch_commits(self, branch_name: str) -> list[Commit]:
-        """Get commits from a branch.
+        Compares the commit against the branch head in a single request,
+        however deep the commit sits in the branch's history.
 
         Args:
             branch_name: Name of the branch (e.g., 'release/v1.2').
+            commit_sha: SHA of the commit to look for.
 
         Returns:
-            List of Commit objects from the branch.
+            True if the branch head is the commit or is ahead of it.
 
         Raises:
-            GithubException: If branch doesn't exist or access fails.
+            GithubException: If the branch or commit doesn't exist or access fails.
 
         References:
-            - List commits: https://docs.github.com/en/rest/commits/commits#list-commits
+            - Compare two commits: https://docs.github.com/en/rest/commits/commits#compare-two-commits
         """
-        return list(self._repo.get_commits(sha=branch_name))
+        comparison = self._repo.compare(commit_sha, branch_name)
+        return comparison.status in ("identical", "ahead")
 
     def tag_exists(self, tag_name: str) -> bool:
         """Check if a tag exists in the repository.
 
+        Answered from the cached tag listing when one is available.
+
         Args:
             tag_name: Name of the tag to check.
 
         Returns:
             True if the tag exists, False otherwise.
 
+        Raises:
+            GithubException: If the lookup fails for any reason other than a
+                missing tag (e.g., rate limiting or a server error).
+
         References:
             - Get a reference: https://docs.github.com/en/rest/git/refs#get-a-reference
         """
+        cached = self._cached_tag_commits()
+        if cached is not None:
+            return tag_name in cached
+
         try:
-            self._repo.get_git_ref(f"tags/{tag_name}")
-            return True
-        except GithubException:
+            # The ref is fetched lazily, so reading its target issues the GET
+            return self._repo.get_git_ref(f"tags/{tag_name}").object is not None
+        except GithubException as e:
+            # Only a 404 means the tag is missing; anything else is a real failure
+            if e.status != 404:
+                raise
             return False
 
     def get_tag_commit_sha(self, tag_name: str) -> str | None:
         """Get the commit SHA that a tag points to.
 
+        Answered from the cached tag listing when one is available; the
+        listing already carries the dereferenced commit of annotated tags.
+
         Args:
             tag_name: Name of the tag.
 
         Returns:
             Commit SHA string, or None if tag doesn't exist.
 
+        Raises:
+            GithubException: If the lookup fails for any reason other than a
+                missing tag (e.g., rate limiting or a server error).
+
         References:
             - Get a reference: https://docs.github.com/en/rest/git/refs#get-a-reference
             - Get a tag: https://docs.github.com/en/rest/git/tags#get-a-tag
         """
+        cached = self._cached_tag_commits()
+        if cached is not None:
+            return cached.get(tag_name)
+
         try:
             ref = self._repo.get_git_ref(f"tags/{tag_name}")
             # Handle annotated tags (need to dereference)
@@ -186,5 +410,7 @@ class GitHubAPI:
                 tag_obj = self._repo.get_git_tag(tag_sha)
                 return tag_obj.object.sha
             return tag_sha
-        except GithubException:
+        except GithubException as e:
+            if e.status != 404:
+                raise
             return None
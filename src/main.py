@@ -16,7 +16,7 @@ import argparse
 import logging
 import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import TYPE_CHECKING
 
 from src.aliases import update_alias_tags
@@ -25,23 +25,22 @@ from src.branch import (
     should_skip_minor_alias,
     validate_prefix,
 )
-from src.github_api import GitHubAPI
+from src.github_api import GitHubAPI, TagRef
 from src.tags import (
     create_tag,
     ga_exists,
     get_next_patch_tag,
     get_next_rc_tag,
-    is_ga_tag,
-    is_rc_tag,
+    parse_tag_type,
 )
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionInputs:
     """Parsed action inputs from environment variables."""
 
@@ -54,7 +53,7 @@ class ActionInputs:
     tag_prefix: str = "v"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GitHubContext:
     """GitHub event context from environment variables."""
 
@@ -65,7 +64,7 @@ class GitHubContext:
     repository: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionOutputs:
     """Action outputs to be written to GITHUB_OUTPUT."""
 
@@ -118,7 +117,7 @@ Examples:
 
     parser.add_argument(
         "--token",
-        default=os.environ.get("INPUT_TOKEN", os.environ.get("GITHUB_TOKEN", "")),
+        default=os.environ.get("INPUT_TOKEN") or os.environ.get("GITHUB_TOKEN", ""),
         help="GitHub token for authentication (default: from INPUT_TOKEN or GITHUB_TOKEN env)",
     )
     parser.add_argument(
@@ -175,15 +174,8 @@ Examples:
         )
         sys.exit(1)
 
-    return ActionInputs(
-        token=parsed.token,
-        debug=parsed.debug,
-        dry_run=parsed.dry_run,
-        target_branch=parsed.target_branch,
-        aliases=parsed.aliases,
-        release_prefix=parsed.release_prefix,
-        tag_prefix=parsed.tag_prefix,
-    )
+    # Argument dests match the ActionInputs field names one-to-one
+    return ActionInputs(**{field.name: getattr(parsed, field.name) for field in fields(ActionInputs)})
 
 
 def parse_context() -> GitHubContext:
@@ -218,11 +210,10 @@ def set_outputs(outputs: ActionOutputs) -> None:
         logger.warning("GITHUB_OUTPUT not set, outputs will not be written")
         return
 
+    # Append every output in one write so the lines land together
+    payload = f"tag={outputs.tag}\ntag-type={outputs.tag_type}\nmajor={outputs.major}\nminor={outputs.minor}\n"
     with open(output_file, "a") as f:
-        f.write(f"tag={outputs.tag}\n")
-        f.write(f"tag-type={outputs.tag_type}\n")
-        f.write(f"major={outputs.major}\n")
-        f.write(f"minor={outputs.minor}\n")
+        f.write(payload)
 
     logger.info("Set outputs: tag=%s, tag-type=%s", outputs.tag, outputs.tag_type)
 
@@ -287,22 +278,33 @@ def handle_branch_create(
     return outputs
 
 
-def _commit_has_version_tag(api: GitHubAPI, commit_sha: str, tag_prefix: str) -> str | None:
+def _commit_has_version_tag(
+    api: GitHubAPI,
+    commit_sha: str,
+    tag_prefix: str,
+    tags: list[TagRef] | None = None,
+) -> str | None:
     """Check if a commit already has a version tag.
 
+    Only RC, GA and patch tags count; alias tags such as 'v1' or 'v1.2'
+    share the commit of the release they track and are ignored.
+
     Args:
         api: GitHubAPI instance.
         commit_sha: SHA of the commit to check.
         tag_prefix: The configured tag prefix.
+        tags: Tag listing already fetched by the caller; defaults to listing
+            the tags through the API.
 
     Returns:
-        The existing tag name if found, None otherwise.
+        The existing version tag name if found, None otherwise.
     """
-    tags = api.list_tags()
-    for tag in tags:
-        if tag.commit.sha == commit_sha and tag.name.startswith(tag_prefix):
-            return tag.name
-    return None
+    if tags is None:
+        tags = api.list_tags()
+    return next(
+        (tag.name for tag in tags if tag.commit_sha == commit_sha and parse_tag_type(tag.name, tag_prefix) is not None),
+        None,
+    )
 
 
 def handle_commit_push(
@@ -342,8 +344,11 @@ def handle_commit_push(
     outputs.major = str(version.major)
     outputs.minor = str(version.minor)
 
+    # Fetch the tag listing once and share it with every scan below
+    tags = api.list_tags()
+
     # Check if commit already has a version tag
-    existing_tag = _commit_has_version_tag(api, context.sha, inputs.tag_prefix)
+    existing_tag = _commit_has_version_tag(api, context.sha, inputs.tag_prefix, tags)
     if existing_tag:
         logger.info(
             "Commit %s already has tag '%s', skipping tag creation",
@@ -356,7 +361,7 @@ def handle_commit_push(
 
     if ga_exists(api, version.major, version.minor, inputs.tag_prefix):
         # GA exists, create next patch tag
-        tag_name = get_next_patch_tag(api, version.major, version.minor, inputs.tag_prefix)
+        tag_name = get_next_patch_tag(api, version.major, version.minor, inputs.tag_prefix, tags)
         outputs.tag = tag_name
         outputs.tag_type = "patch"
 
@@ -367,10 +372,17 @@ def handle_commit_push(
             logger.info("Created patch tag '%s'", tag_name)
             # Update alias tags for non-RC releases if enabled
             if inputs.aliases:
-                _update_aliases_with_skip_logic(api, tag_name, context.sha, inputs)
+                _update_aliases_with_skip_logic(
+                    api,
+                    tag_name,
+                    context.sha,
+                    inputs,
+                    is_latest_patch=True,
+                    tags=[*tags, TagRef(name=tag_name, commit_sha=context.sha)],
+                )
     else:
         # No GA, create next RC tag
-        tag_name = get_next_rc_tag(api, version.major, version.minor, inputs.tag_prefix)
+        tag_name = get_next_rc_tag(api, version.major, version.minor, inputs.tag_prefix, tags)
         outputs.tag = tag_name
         outputs.tag_type = "rc"
 
@@ -407,9 +419,9 @@ def handle_tag_push(
     outputs = ActionOutputs()
     tag_name = context.ref_name
 
-    # Parse the tag to extract version info
-    version = _parse_tag_version(tag_name, inputs.tag_prefix)
-    if version is None:
+    # Parse the tag to extract version info and release type in one pass
+    parsed = parse_tag_type(tag_name, inputs.tag_prefix)
+    if parsed is None:
         logger.warning(
             "Tag '%s' is not a valid SemVer tag with prefix '%s', skipping",
             tag_name,
@@ -417,7 +429,7 @@ def handle_tag_push(
         )
         return outputs
 
-    major, minor = version
+    major, minor, tag_type = parsed
     outputs.major = str(major)
     outputs.minor = str(minor)
     outputs.tag = tag_name
@@ -434,11 +446,10 @@ def handle_tag_push(
         )
         sys.exit(1)
 
-    # Determine tag type
-    if is_rc_tag(tag_name, inputs.tag_prefix):
+    if tag_type == "rc":
         outputs.tag_type = "rc"
         logger.info("Validated RC tag '%s'", tag_name)
-    elif is_ga_tag(tag_name, inputs.tag_prefix):
+    elif tag_type == "ga":
         outputs.tag_type = "ga"
         logger.info("Validated GA tag '%s'", tag_name)
         if not inputs.dry_run and inputs.aliases:
@@ -488,35 +499,6 @@ def handle_workflow_dispatch(
     return handle_commit_push(api, context, inputs, branch_name=target_branch)
 
 
-def _parse_tag_version(tag_name: str, tag_prefix: str = "v") -> tuple[int, int] | None:
-    """Parse major and minor version from a tag name.
-
-    Args:
-        tag_name: Tag name (e.g., 'v1.2.0', 'v1.2.0-rc1', 'v1.2.3').
-        tag_prefix: The tag prefix to match (default: 'v').
-
-    Returns:
-        Tuple of (major, minor) or None if not a valid version tag.
-    """
-    import re
-
-    escaped_prefix = re.escape(tag_prefix)
-
-    # Match RC tags: {prefix}X.Y.0-rcN
-    rc_pattern = f"^{escaped_prefix}(\\d+)\\.(\\d+)\\.0-rc\\d+$"
-    rc_match = re.match(rc_pattern, tag_name)
-    if rc_match:
-        return int(rc_match.group(1)), int(rc_match.group(2))
-
-    # Match GA/patch tags: {prefix}X.Y.Z
-    patch_pattern = f"^{escaped_prefix}(\\d+)\\.(\\d+)\\.\\d+$"
-    patch_match = re.match(patch_pattern, tag_name)
-    if patch_match:
-        return int(patch_match.group(1)), int(patch_match.group(2))
-
-    return None
-
-
 def _validate_tag_on_branch(api: GitHubAPI, commit_sha: str, branch_name: str) -> bool:
     """Validate that a commit is reachable from a branch.
 
@@ -529,11 +511,9 @@ def _validate_tag_on_branch(api: GitHubAPI, commit_sha: str, branch_name: str) -
         True if the commit is on the branch, False otherwise.
     """
     try:
-        commits = api.get_branch_commits(branch_name)
-        commit_shas = {c.sha for c in commits}
-        return commit_sha in commit_shas
+        return api.is_ancestor(branch_name, commit_sha)
     except Exception as e:
-        logger.error("Failed to get commits from branch '%s': %s", branch_name, e)
+        logger.error("Failed to check whether branch '%s' contains commit '%s': %s", branch_name, commit_sha, e)
         return False
 
 
@@ -542,6 +522,8 @@ def _update_aliases_with_skip_logic(
     tag_name: str,
     commit_sha: str,
     inputs: ActionInputs,
+    is_latest_patch: bool = False,
+    tags: list[TagRef] | None = None,
 ) -> dict[str, bool]:
     """Update alias tags with skip logic for minor alias when prefixes match.
 
@@ -550,6 +532,9 @@ def _update_aliases_with_skip_logic(
         tag_name: The release tag name (e.g., 'v1.2.3').
         commit_sha: SHA of the commit the release tag points to.
         inputs: Action inputs containing prefix configuration.
+        is_latest_patch: True if tag_name was just computed as the next patch
+            of its minor series.
+        tags: Tag listing already fetched by the caller, including tag_name.
 
     Returns:
         Dict with 'major' and 'minor' keys indicating if each alias was updated.
@@ -564,9 +549,21 @@ def _update_aliases_with_skip_logic(
         commit_sha,
         tag_prefix=inputs.tag_prefix,
         skip_minor_alias=skip_minor,
+        is_latest_patch=is_latest_patch,
+        tags=tags,
     )
 
 
+# Event handlers keyed by (event name, ref type); an empty ref type matches
+# any ref type for that event
+_EVENT_HANDLERS: dict[tuple[str, str], Callable[[GitHubAPI, GitHubContext, ActionInputs], ActionOutputs]] = {
+    ("create", "branch"): handle_branch_create,
+    ("push", "tag"): handle_tag_push,
+    ("push", "branch"): handle_commit_push,
+    ("workflow_dispatch", ""): handle_workflow_dispatch,
+}
+
+
 def main() -> None:
     """Main entry point for the action."""
     inputs = parse_inputs()
@@ -581,50 +578,28 @@ def main() -> None:
         logger.error("GitHub token is required. Set INPUT_TOKEN or GITHUB_TOKEN.")
         sys.exit(1)
 
-    # Initialize API (skip for dry-run without token)
-    api: GitHubAPI | None = None
-    if not inputs.dry_run or inputs.token:  # pragma: no branch
-        try:
-            api = GitHubAPI(token=inputs.token, repository=context.repository)
-        except ValueError as e:
-            logger.error("Failed to initialize GitHub API: %s", e)
-            sys.exit(1)
-
     # Route events to handlers
-    outputs = ActionOutputs()
-
-    if context.event_name == "create" and context.ref_type == "branch":
-        if api is None:  # pragma: no cover
-            logger.error("GitHub API required for branch creation")
-            sys.exit(1)
-        outputs = handle_branch_create(api, context, inputs)
-
-    elif context.event_name == "push" and context.ref_type == "tag":
-        if api is None:  # pragma: no cover
-            logger.error("GitHub API required for tag push")
-            sys.exit(1)
-        outputs = handle_tag_push(api, context, inputs)
-
-    elif context.event_name == "push" and context.ref_type == "branch":
-        if api is None:  # pragma: no cover
-            logger.error("GitHub API required for commit push")
-            sys.exit(1)
-        outputs = handle_commit_push(api, context, inputs)
-
-    elif context.event_name == "workflow_dispatch":
-        if api is None:  # pragma: no cover
-            logger.error("GitHub API required for workflow_dispatch")
-            sys.exit(1)
-        outputs = handle_workflow_dispatch(api, context, inputs)
-
-    else:
+    handler = _EVENT_HANDLERS.get((context.event_name, context.ref_type)) or _EVENT_HANDLERS.get(
+        (context.event_name, "")
+    )
+    if handler is None:
         logger.warning(
             "Unhandled event: %s (ref_type: %s). Skipping.",
             context.event_name,
             context.ref_type,
         )
+        set_outputs(ActionOutputs())
+        return
+
+    # Dry-run still reads tags to report what would be created; constructing
+    # the client makes no requests until a handler needs one
+    try:
+        api = GitHubAPI(token=inputs.token, repository=context.repository)
+    except ValueError as e:
+        logger.error("Failed to initialize GitHub API: %s", e)
+        sys.exit(1)
 
-    set_outputs(outputs)
+    set_outputs(handler(api, context, inputs))
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -10,49 +10,146 @@ References:
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
+
+from src.branch import is_plain_number
 
 if TYPE_CHECKING:
-    from src.github_api import GitHubAPI
+    from collections.abc import Iterable
+
+    from src.github_api import GitHubAPI, TagRef
 
 logger = logging.getLogger(__name__)
 
-# Pattern for RC tags: vX.Y.0-rcN (default prefix)
-RC_TAG_PATTERN = re.compile(r"^v(\d+)\.(\d+)\.0-rc(\d+)$")
+# Pattern for RC tags: vX.Y.0-rcN (default prefix, ASCII digits only)
+RC_TAG_PATTERN = re.compile(r"^v([0-9]+)\.([0-9]+)\.0-rc([0-9]+)$", re.ASCII)
+
+# Pattern for GA/patch tags: vX.Y.Z (where Z >= 0, default prefix, ASCII digits only)
+PATCH_TAG_PATTERN = re.compile(r"^v([0-9]+)\.([0-9]+)\.([0-9]+)$", re.ASCII)
 
-# Pattern for GA/patch tags: vX.Y.Z (where Z >= 0, default prefix)
-PATCH_TAG_PATTERN = re.compile(r"^v(\d+)\.(\d+)\.(\d+)$")
+
+@functools.lru_cache(maxsize=16)
+def _compile_rc_pattern(tag_prefix: str) -> re.Pattern[str]:
+    """Compile and cache the RC tag pattern for a non-default prefix."""
+    escaped_prefix = re.escape(tag_prefix)
+    return re.compile(f"^{escaped_prefix}([0-9]+)\\.([0-9]+)\\.0-rc([0-9]+)$", re.ASCII)
 
 
-def _create_rc_pattern(tag_prefix: str) -> re.Pattern[str]:
+@functools.lru_cache(maxsize=16)
+def _compile_patch_pattern(tag_prefix: str) -> re.Pattern[str]:
+    """Compile and cache the GA/patch tag pattern for a non-default prefix."""
+    escaped_prefix = re.escape(tag_prefix)
+    return re.compile(f"^{escaped_prefix}([0-9]+)\\.([0-9]+)\\.([0-9]+)$", re.ASCII)
+
+
+def create_rc_pattern(tag_prefix: str) -> re.Pattern[str]:
     """Create regex pattern for RC tags with given prefix.
 
+    The default 'v' prefix returns the prebuilt RC_TAG_PATTERN; other
+    prefixes are compiled once and cached. Patterns accept ASCII digits
+    only; callers match with ``fullmatch``.
+
     Args:
         tag_prefix: The prefix for tags (e.g., 'v', 'pkg-v').
 
     Returns:
         Compiled regex pattern matching {prefix}X.Y.0-rcN.
     """
-    escaped_prefix = re.escape(tag_prefix)
-    return re.compile(f"^{escaped_prefix}(\\d+)\\.(\\d+)\\.0-rc(\\d+)$")
+    if tag_prefix == "v":
+        return RC_TAG_PATTERN
+    return _compile_rc_pattern(tag_prefix)
 
 
-def _create_patch_pattern(tag_prefix: str) -> re.Pattern[str]:
+def create_patch_pattern(tag_prefix: str) -> re.Pattern[str]:
     """Create regex pattern for GA/patch tags with given prefix.
 
+    The default 'v' prefix returns the prebuilt PATCH_TAG_PATTERN; other
+    prefixes are compiled once and cached. Patterns accept ASCII digits
+    only; callers match with ``fullmatch``.
+
     Args:
         tag_prefix: The prefix for tags (e.g., 'v', 'pkg-v').
 
     Returns:
         Compiled regex pattern matching {prefix}X.Y.Z.
     """
-    escaped_prefix = re.escape(tag_prefix)
-    return re.compile(f"^{escaped_prefix}(\\d+)\\.(\\d+)\\.(\\d+)$")
+    if tag_prefix == "v":
+        return PATCH_TAG_PATTERN
+    return _compile_patch_pattern(tag_prefix)
+
 
+def _fast_parse_tag(tag_name: str, tag_prefix: str) -> tuple[int, int, int, int | None] | None:
+    """Parse a canonical {prefix}X.Y.Z[-rcN] tag with string operations.
 
-def find_latest_rc(api: GitHubAPI, major: int, minor: int, tag_prefix: str = "v") -> int | None:
+    Names with leading zeros or non-ASCII digits are not handled here and
+    return None, so callers fall back to the tag patterns for them.
+
+    Args:
+        tag_name: The tag name to parse (e.g., 'v1.2.0-rc1').
+        tag_prefix: The tag prefix to match.
+
+    Returns:
+        Tuple of (major, minor, patch, rc), with rc None for tags without an
+        RC suffix, or None if the name is not in canonical form.
+    """
+    if not tag_name.startswith(tag_prefix):
+        return None
+
+    version, separator, rc = tag_name[len(tag_prefix) :].partition("-rc")
+    parts = version.split(".")
+    if len(parts) != 3 or not all(is_plain_number(part) for part in parts):
+        return None
+    if not separator:
+        return int(parts[0]), int(parts[1]), int(parts[2]), None
+    if not is_plain_number(rc):
+        return None
+    return int(parts[0]), int(parts[1]), int(parts[2]), int(rc)
+
+
+def _series_tag_names(
+    api: GitHubAPI,
+    major: int,
+    minor: int,
+    tag_prefix: str,
+    tags: Iterable[TagRef] | None,
+) -> Iterable[str]:
+    """Return the tag names to scan for a release series.
+
+    Without a caller-supplied listing, only the tags under {prefix}X.Y. are
+    fetched, filtered server-side, instead of paging through every tag. A
+    supplied listing is narrowed with the same literal prefix, so the tag
+    patterns only run on names in the series.
+
+    Both paths match the series literally, so only canonical names count:
+    a non-canonical spelling such as v01.2.0-rc5 is not part of the 1.2
+    series, even though the tag patterns would parse it.
+
+    Args:
+        api: GitHubAPI instance for fetching tags.
+        major: Major version number.
+        minor: Minor version number.
+        tag_prefix: The tag prefix to match.
+        tags: Tag listing already fetched by the caller, or None.
+
+    Returns:
+        Iterable of tag names.
+    """
+    series_prefix = f"{tag_prefix}{major}.{minor}."
+    if tags is None:
+        return api.list_tag_refs(series_prefix)
+    return (tag.name for tag in tags if tag.name.startswith(series_prefix))
+
+
+def find_latest_rc(
+    api: GitHubAPI,
+    major: int,
+    minor: int,
+    tag_prefix: str = "v",
+    tags: Iterable[TagRef] | None = None,
+) -> int | None:
     """Find the highest RC number for {prefix}X.Y.0-rcN tags.
 
     Args:
@@ -60,6 +157,8 @@ def find_latest_rc(api: GitHubAPI, major: int, minor: int, tag_prefix: str = "v"
         major: Major version number.
         minor: Minor version number.
         tag_prefix: The tag prefix to match (default: 'v').
+        tags: Tag listing already fetched by the caller; defaults to
+            listing only the tags under {prefix}X.Y. through the API.
 
     Returns:
         The highest RC number found, or None if no RC tags exist.
@@ -72,24 +171,27 @@ def find_latest_rc(api: GitHubAPI, major: int, minor: int, tag_prefix: str = "v"
     References:
         - Requirements 3.2, 3.3
     """
-    tags = api.list_tags()
     highest_rc = None
-    pattern = _create_rc_pattern(tag_prefix)
+    pattern = create_rc_pattern(tag_prefix)
 
-    for tag in tags:
-        match = pattern.match(tag.name)
+    # Names are already limited to the X.Y series; the pattern validates the rest
+    for name in _series_tag_names(api, major, minor, tag_prefix, tags):
+        match = pattern.fullmatch(name)
         if match:
-            tag_major = int(match.group(1))
-            tag_minor = int(match.group(2))
             rc_num = int(match.group(3))
-
-            if tag_major == major and tag_minor == minor and (highest_rc is None or rc_num > highest_rc):
+            if highest_rc is None or rc_num > highest_rc:
                 highest_rc = rc_num
 
     return highest_rc
 
 
-def find_latest_patch(api: GitHubAPI, major: int, minor: int, tag_prefix: str = "v") -> int | None:
+def find_latest_patch(
+    api: GitHubAPI,
+    major: int,
+    minor: int,
+    tag_prefix: str = "v",
+    tags: Iterable[TagRef] | None = None,
+) -> int | None:
     """Find the highest patch number for {prefix}X.Y.Z tags.
 
     Args:
@@ -97,6 +199,8 @@ def find_latest_patch(api: GitHubAPI, major: int, minor: int, tag_prefix: str =
         major: Major version number.
         minor: Minor version number.
         tag_prefix: The tag prefix to match (default: 'v').
+        tags: Tag listing already fetched by the caller; defaults to
+            listing only the tags under {prefix}X.Y. through the API.
 
     Returns:
         The highest patch number found, or None if no patch tags exist.
@@ -109,18 +213,15 @@ def find_latest_patch(api: GitHubAPI, major: int, minor: int, tag_prefix: str =
     References:
         - Requirements 4.2, 4.3
     """
-    tags = api.list_tags()
     highest_patch = None
-    pattern = _create_patch_pattern(tag_prefix)
+    pattern = create_patch_pattern(tag_prefix)
 
-    for tag in tags:
-        match = pattern.match(tag.name)
+    # Names are already limited to the X.Y series; the pattern validates the rest
+    for name in _series_tag_names(api, major, minor, tag_prefix, tags):
+        match = pattern.fullmatch(name)
         if match:
-            tag_major = int(match.group(1))
-            tag_minor = int(match.group(2))
             patch_num = int(match.group(3))
-
-            if tag_major == major and tag_minor == minor and (highest_patch is None or patch_num > highest_patch):
+            if highest_patch is None or patch_num > highest_patch:
                 highest_patch = patch_num
 
     return highest_patch
@@ -224,7 +325,13 @@ def increment_patch(current_patch: int | None) -> int:
     return current_patch + 1
 
 
-def get_next_rc_tag(api: GitHubAPI, major: int, minor: int, tag_prefix: str = "v") -> str:
+def get_next_rc_tag(
+    api: GitHubAPI,
+    major: int,
+    minor: int,
+    tag_prefix: str = "v",
+    tags: Iterable[TagRef] | None = None,
+) -> str:
     """Get the next RC tag name for a version.
 
     Args:
@@ -232,6 +339,8 @@ def get_next_rc_tag(api: GitHubAPI, major: int, minor: int, tag_prefix: str = "v
         major: Major version number.
         minor: Minor version number.
         tag_prefix: The tag prefix to use (default: 'v').
+        tags: Tag listing already fetched by the caller; defaults to
+            scanning the repository's tags through the API.
 
     Returns:
         The next RC tag name (e.g., 'v1.2.0-rc1' or 'v1.2.0-rc4').
@@ -245,12 +354,18 @@ def get_next_rc_tag(api: GitHubAPI, major: int, minor: int, tag_prefix: str = "v
     References:
         - Requirements 2.1, 3.1, 3.2, 3.3
     """
-    latest_rc = find_latest_rc(api, major, minor, tag_prefix)
+    latest_rc = find_latest_rc(api, major, minor, tag_prefix, tags)
     next_rc = increment_rc(latest_rc)
     return f"{tag_prefix}{major}.{minor}.0-rc{next_rc}"
 
 
-def get_next_patch_tag(api: GitHubAPI, major: int, minor: int, tag_prefix: str = "v") -> str:
+def get_next_patch_tag(
+    api: GitHubAPI,
+    major: int,
+    minor: int,
+    tag_prefix: str = "v",
+    tags: Iterable[TagRef] | None = None,
+) -> str:
     """Get the next patch tag name for a version.
 
     Args:
@@ -258,6 +373,8 @@ def get_next_patch_tag(api: GitHubAPI, major: int, minor: int, tag_prefix: str =
         major: Major version number.
         minor: Minor version number.
         tag_prefix: The tag prefix to use (default: 'v').
+        tags: Tag listing already fetched by the caller; defaults to
+            scanning the repository's tags through the API.
 
     Returns:
         The next patch tag name (e.g., 'v1.2.1' or 'v1.2.5').
@@ -271,11 +388,77 @@ def get_next_patch_tag(api: GitHubAPI, major: int, minor: int, tag_prefix: str =
     References:
         - Requirements 4.1, 4.2, 4.3
     """
-    latest_patch = find_latest_patch(api, major, minor, tag_prefix)
+    latest_patch = find_latest_patch(api, major, minor, tag_prefix, tags)
     next_patch = increment_patch(latest_patch)
     return f"{tag_prefix}{major}.{minor}.{next_patch}"
 
 
+@functools.lru_cache(maxsize=256)
+def parse_tag_type(tag_name: str, tag_prefix: str = "v") -> tuple[int, int, Literal["rc", "ga", "patch"]] | None:
+    """Parse a release tag's series and classify it in a single parse.
+
+    Canonical names are split with string operations; anything else falls
+    back to the RC and patch patterns. Results are cached by
+    (tag_name, tag_prefix).
+
+    Args:
+        tag_name: The tag name to parse.
+        tag_prefix: The tag prefix to match (default: 'v').
+
+    Returns:
+        Tuple of (major, minor, tag_type), where tag_type is 'rc' for
+        {prefix}X.Y.0-rcN, 'ga' for {prefix}X.Y.0 and 'patch' for
+        {prefix}X.Y.Z with Z > 0, or None if the tag is none of these.
+
+    Examples:
+        >>> parse_tag_type("v1.2.0-rc1")
+        (1, 2, 'rc')
+        >>> parse_tag_type("v1.2.3")
+        (1, 2, 'patch')
+        >>> parse_tag_type("v1.2.3-rc1") is None
+        True
+    """
+    parsed = _fast_parse_tag(tag_name, tag_prefix)
+    if parsed is not None:
+        major, minor, patch, rc = parsed
+        if rc is not None:
+            return (major, minor, "rc") if patch == 0 else None
+        return major, minor, "ga" if patch == 0 else "patch"
+
+    match = create_rc_pattern(tag_prefix).fullmatch(tag_name)
+    if match:
+        return int(match.group(1)), int(match.group(2)), "rc"
+    match = create_patch_pattern(tag_prefix).fullmatch(tag_name)
+    if match:
+        return int(match.group(1)), int(match.group(2)), "ga" if int(match.group(3)) == 0 else "patch"
+    return None
+
+
+def classify_tag(tag_name: str, tag_prefix: str = "v") -> Literal["rc", "ga", "patch"] | None:
+    """Classify a tag as an RC, GA or patch release.
+
+    Args:
+        tag_name: The tag name to classify.
+        tag_prefix: The tag prefix to match (default: 'v').
+
+    Returns:
+        'rc' for {prefix}X.Y.0-rcN, 'ga' for {prefix}X.Y.0, 'patch' for
+        {prefix}X.Y.Z with Z > 0, or None if the tag is none of these.
+
+    Examples:
+        >>> classify_tag("v1.2.0-rc1")
+        'rc'
+        >>> classify_tag("v1.2.0")
+        'ga'
+        >>> classify_tag("v1.2.3")
+        'patch'
+        >>> classify_tag("v1.2.3-rc1") is None
+        True
+    """
+    parsed = parse_tag_type(tag_name, tag_prefix)
+    return None if parsed is None else parsed[2]
+
+
 def is_rc_tag(tag_name: str, tag_prefix: str = "v") -> bool:
     """Check if a tag is an RC tag.
 
@@ -292,8 +475,7 @@ def is_rc_tag(tag_name: str, tag_prefix: str = "v") -> bool:
         >>> is_rc_tag("v1.2.0")
         False
     """
-    pattern = _create_rc_pattern(tag_prefix)
-    return pattern.match(tag_name) is not None
+    return classify_tag(tag_name, tag_prefix) == "rc"
 
 
 def is_ga_tag(tag_name: str, tag_prefix: str = "v") -> bool:
@@ -314,12 +496,7 @@ def is_ga_tag(tag_name: str, tag_prefix: str = "v") -> bool:
         >>> is_ga_tag("v1.2.0-rc1")
         False
     """
-    pattern = _create_patch_pattern(tag_prefix)
-    match = pattern.match(tag_name)
-    if match:
-        patch = int(match.group(3))
-        return patch == 0
-    return False
+    return classify_tag(tag_name, tag_prefix) == "ga"
 
 
 def is_patch_tag(tag_name: str, tag_prefix: str = "v") -> bool:
@@ -340,9 +517,4 @@ def is_patch_tag(tag_name: str, tag_prefix: str = "v") -> bool:
         >>> is_patch_tag("v1.2.0-rc1")
         False
     """
-    pattern = _create_patch_pattern(tag_prefix)
-    match = pattern.match(tag_name)
-    if match:
-        patch = int(match.group(3))
-        return patch > 0
-    return False
+    return classify_tag(tag_name, tag_prefix) == "patch"
@@ -1,48 +1,81 @@
 """Shared pytest fixtures for the test suite."""
 
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.github_api import TagRef
 
-def make_tag(name: str, commit_sha: str = "default_sha") -> MagicMock:
-    """Create a mock tag object with the given name.
 
-    This is a shared helper for creating mock GitHub tag objects
+def make_tag(name: str, commit_sha: str = "default_sha") -> TagRef:
+    """Create a tag record with the given name.
+
+    This is a shared helper for creating the tag records GitHubAPI lists,
     used across multiple test modules.
 
     Args:
         name: The tag name (e.g., 'v1.2.0').
         commit_sha: The SHA of the commit the tag points to.
     """
-    tag = MagicMock()
-    tag.name = name
-    tag.commit = MagicMock()
-    tag.commit.sha = commit_sha
-    return tag
+    return TagRef(name=name, commit_sha=commit_sha)
 
 
-def make_commit(sha: str) -> MagicMock:
-    """Create a mock commit object with the given SHA.
+def make_commit(sha: str) -> SimpleNamespace:
+    """Create a stand-in commit object with the given SHA.
 
-    This is a shared helper for creating mock GitHub commit objects
-    used across multiple test modules.
+    This is a shared helper for creating GitHub commit stand-ins used across
+    multiple test modules. Only ``sha`` is read, so a plain namespace is used
+    instead of a MagicMock.
+    """
+    return SimpleNamespace(sha=sha)
+
+
+def make_mock_api() -> MagicMock:
+    """Create a mock GitHubAPI whose derived listings follow list_tags.
+
+    Tests only need to configure ``list_tags`` and ``branch_commits``, a
+    test-only stand-in returning the commits on a branch; the streamed tag
+    listing, prefix-filtered ref listings and branch membership checks are
+    computed from them so every view of the repository stays consistent.
+    """
+    mock_api = MagicMock()
+    mock_api.list_tags.return_value = []
+    mock_api.iter_tags.side_effect = lambda: iter(mock_api.list_tags())
+    mock_api.is_ancestor.side_effect = lambda branch_name, commit_sha: any(
+        commit.sha == commit_sha for commit in mock_api.branch_commits(branch_name)
+    )
+    mock_api.list_tag_refs.side_effect = lambda prefix: [
+        tag.name for tag in mock_api.list_tags() if tag.name.startswith(prefix)
+    ]
+    return mock_api
+
+
+def alias_updates(mock_api: MagicMock) -> dict[str, str]:
+    """Collect the alias tags force-updated or created on the mock API.
+
+    Args:
+        mock_api: The mock GitHubAPI passed to the code under test.
+
+    Returns:
+        Mapping of alias tag name to the commit SHA it was pointed at.
     """
-    commit = MagicMock()
-    commit.sha = sha
-    return commit
+    aliases = {call.args[0]: call.args[1] for call in mock_api.update_tag.call_args_list}
+    for call in mock_api.create_tag.call_args_list:
+        if len(call.args) > 2 and call.args[2].startswith("Alias tag"):
+            aliases[call.args[0]] = call.args[1]
+    return aliases
 
 
 @pytest.fixture
 def mock_github_api() -> MagicMock:
     """Create a mock GitHubAPI instance for unit tests."""
-    mock_api = MagicMock()
-    mock_api.list_tags.return_value = []
+    mock_api = make_mock_api()
     mock_api.create_tag.return_value = None
     mock_api.update_tag.return_value = None
-    mock_api.get_branch_commits.return_value = []
+    mock_api.branch_commits.return_value = []
     return mock_api
 
 
@@ -71,36 +104,38 @@ def mock_pygithub() -> Generator[dict[str, Any], None, None]:
         yield {"github": mock_github, "repo": mock_repo}
 
 
-@pytest.fixture
-def sample_tags() -> list[str]:
-    """Sample tag data for testing."""
-    return [
+@pytest.fixture(scope="session")
+def sample_tags() -> tuple[str, ...]:
+    """Sample tag data for testing, shared read-only across the session."""
+    return (
         "v1.0.0-rc1",
         "v1.0.0-rc2",
         "v1.0.0",
         "v1.0.1",
         "v1.1.0-rc1",
         "v2.0.0-rc1",
-    ]
-
-
-@pytest.fixture
-def sample_branches() -> dict[str, list[str]]:
-    """Sample branch names for testing."""
-    return {
-        "valid": [
-            "release/v1.0",
-            "release/v1.2",
-            "release/v0.1",
-            "release/v10.20",
-        ],
-        "invalid": [
-            "release/v01.2",  # Leading zero
-            "release/1.2",  # Missing 'v'
-            "feature/v1.2",  # Wrong prefix
-            "release/v1",  # Missing minor
-            "release/v1.2.3",  # Has patch
-            "main",
-            "develop",
-        ],
-    }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_branches() -> Mapping[str, tuple[str, ...]]:
+    """Sample branch names for testing, shared read-only across the session."""
+    return MappingProxyType(
+        {
+            "valid": (
+                "release/v1.0",
+                "release/v1.2",
+                "release/v0.1",
+                "release/v10.20",
+            ),
+            "invalid": (
+                "release/v01.2",  # Leading zero
+                "release/1.2",  # Missing 'v'
+                "feature/v1.2",  # Wrong prefix
+                "release/v1",  # Missing minor
+                "release/v1.2.3",  # Has patch
+                "main",
+                "develop",
+            ),
+        }
+    )
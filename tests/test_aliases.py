@@ -11,7 +11,12 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import pytest
+from github.GithubException import GithubException
+
 from src.aliases import (
+    _build_version_index,
+    _scan_alias_targets,
     find_highest_major_version,
     find_highest_minor_version,
     is_rc_tag,
@@ -50,6 +55,20 @@ class TestParseReleaseTag:
         assert parse_release_tag("v1.2") is None
         assert parse_release_tag("1.2.3") is None
 
+    def test_leading_zeros_use_regex_fallback(self) -> None:
+        """Test that tags outside the fast path are still parsed by the regex."""
+        assert parse_release_tag("v01.2.03") == (1, 2, 3)
+
+    def test_non_ascii_digits_rejected(self) -> None:
+        """Test that only ASCII digits are accepted as version numbers."""
+        assert parse_release_tag("v\u0661.2.3") is None
+        assert parse_release_tag("v1.2.3\n") is None
+
+    def test_custom_prefix(self) -> None:
+        """Test parsing tags with a custom prefix."""
+        assert parse_release_tag("pkg-1.2.3", "pkg-") == (1, 2, 3)
+        assert parse_release_tag("v1.2.3", "pkg-") is None
+
 
 class TestIsRcTag:
     """Tests for is_rc_tag() function."""
@@ -154,6 +173,13 @@ class TestFindHighestMinorVersion:
         result = find_highest_minor_version(mock_github_api, 1, 2)
         assert result is None
 
+    def test_queries_minor_series_prefix(self, mock_github_api: MagicMock) -> None:
+        """Test that only the minor series' tags are requested."""
+        mock_github_api.list_tags.return_value = [make_tag("v1.2.4"), make_tag("v1.20.0")]
+        result = find_highest_minor_version(mock_github_api, 1, 2)
+        assert result == (1, 2, 4)
+        mock_github_api.list_tag_refs.assert_called_once_with("v1.2.")
+
     def test_no_matching_minor_returns_none(self, mock_github_api: MagicMock) -> None:
         """Test that no matching minor version returns None."""
         mock_github_api.list_tags.return_value = [
@@ -201,6 +227,54 @@ class TestFindHighestMinorVersion:
         assert result == (1, 2, 0)
 
 
+class TestBuildVersionIndex:
+    """Tests for _build_version_index() function."""
+
+    def test_indexes_highest_per_major_and_minor(self) -> None:
+        """Test that both maps hold the highest release of each series."""
+        names = ["v1.2.0", "v1.2.4", "v1.3.1", "v1.3.0-rc1", "v2.0.0", "invalid"]
+        by_major, by_minor = _build_version_index(names)
+        assert by_major == {1: (1, 3, 1), 2: (2, 0, 0)}
+        assert by_minor == {(1, 2): (1, 2, 4), (1, 3): (1, 3, 1), (2, 0): (2, 0, 0)}
+
+    def test_empty_tag_list(self) -> None:
+        """Test that an empty tag list yields empty indexes."""
+        assert _build_version_index([]) == ({}, {})
+
+    def test_custom_prefix(self) -> None:
+        """Test that only tags with the configured prefix are indexed."""
+        by_major, _ = _build_version_index(["pkg-1.0.0", "v9.0.0"], tag_prefix="pkg-")
+        assert by_major == {1: (1, 0, 0)}
+
+
+class TestScanAliasTargets:
+    """Tests for _scan_alias_targets() helper."""
+
+    def test_highest_release_updates_both(self) -> None:
+        """Test that the highest release moves both aliases."""
+        assert _scan_alias_targets(["v1.1.0", "v1.2.0", "v1.2.1"], (1, 2, 1), "v") == (True, True)
+
+    def test_higher_minor_blocks_major_only(self) -> None:
+        """Test that a later minor series only blocks the major alias."""
+        assert _scan_alias_targets(["v1.2.1", "v1.3.0"], (1, 2, 1), "v") == (True, False)
+
+    def test_empty_series_updates_nothing(self) -> None:
+        """Test that a series without releases moves no alias."""
+        assert _scan_alias_targets(["v2.0.0"], (1, 0, 0), "v") == (False, False)
+
+    def test_stops_at_first_higher_patch(self) -> None:
+        """Test that the scan stops once a higher patch rules out both aliases."""
+        names = iter(["v1.2.5", "v1.2.6", "v1.2.7"])
+        assert _scan_alias_targets(names, (1, 2, 3), "v") == (False, False)
+        assert list(names) == ["v1.2.6", "v1.2.7"]
+
+    def test_stops_at_higher_minor_when_minor_skipped(self) -> None:
+        """Test that only the major alias decides when the minor is skipped."""
+        names = iter(["v1.3.0", "v1.2.9"])
+        assert _scan_alias_targets(names, (1, 2, 3), "v", check_minor=False)[1] is False
+        assert list(names) == ["v1.2.9"]
+
+
 class TestUpdateAliasTags:
     """Tests for update_alias_tags() function."""
 
@@ -214,31 +288,63 @@ class TestUpdateAliasTags:
     def test_updates_both_aliases_for_highest(self, mock_github_api: MagicMock) -> None:
         """Test that both aliases are updated for highest release."""
         mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
-        mock_github_api.tag_exists.return_value = False
 
         result = update_alias_tags(mock_github_api, "v1.2.0", "abc123")
 
         assert result == {"major": True, "minor": True}
 
     def test_force_updates_existing_aliases(self, mock_github_api: MagicMock) -> None:
-        """Test that existing aliases are force-updated."""
+        """Test that existing aliases are force-updated without an existence probe."""
         mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
-        mock_github_api.tag_exists.return_value = True
 
         update_alias_tags(mock_github_api, "v1.2.0", "abc123")
 
         # Should call update_tag for both aliases
         assert mock_github_api.update_tag.call_count == 2
+        mock_github_api.update_tag.assert_any_call("v1", "abc123")
+        mock_github_api.update_tag.assert_any_call("v1.2", "abc123")
+        mock_github_api.create_tag.assert_not_called()
+        mock_github_api.tag_exists.assert_not_called()
 
     def test_creates_new_aliases(self, mock_github_api: MagicMock) -> None:
-        """Test that new aliases are created when they don't exist."""
+        """Test that aliases are created as annotated tags when the update finds no ref."""
         mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
-        mock_github_api.tag_exists.return_value = False
+        mock_github_api.update_tag.side_effect = GithubException(422, {"message": "Reference does not exist"}, None)
 
         update_alias_tags(mock_github_api, "v1.2.0", "abc123")
 
-        # Should call create_tag for both aliases
+        # Should fall back to create_tag for both aliases
+        assert mock_github_api.update_tag.call_count == 2
         assert mock_github_api.create_tag.call_count == 2
+        mock_github_api.create_tag.assert_any_call("v1", "abc123", "Alias tag v1")
+        mock_github_api.create_tag.assert_any_call("v1.2", "abc123", "Alias tag v1.2")
+        mock_github_api.tag_exists.assert_not_called()
+
+    def test_creates_alias_after_not_found(self, mock_github_api: MagicMock) -> None:
+        """Test that a 404 from the update also falls back to create_tag."""
+        mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
+        mock_github_api.update_tag.side_effect = [
+            GithubException(404, {"message": "Not Found"}, None),
+            None,
+        ]
+
+        result = update_alias_tags(mock_github_api, "v1.2.0", "abc123")
+
+        assert result == {"major": True, "minor": True}
+        # Minor alias is written first and created; major alias is updated
+        mock_github_api.create_tag.assert_called_once_with("v1.2", "abc123", "Alias tag v1.2")
+        mock_github_api.update_tag.assert_called_with("v1", "abc123")
+
+    def test_update_failure_is_raised(self, mock_github_api: MagicMock) -> None:
+        """Test that update errors other than 404/422 are not treated as a missing alias."""
+        mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
+        mock_github_api.update_tag.side_effect = GithubException(403, {"message": "Forbidden"}, None)
+
+        with pytest.raises(GithubException) as exc_info:
+            update_alias_tags(mock_github_api, "v1.2.0", "abc123")
+
+        assert exc_info.value.status == 403
+        mock_github_api.create_tag.assert_not_called()
 
     def test_updates_minor_only_for_patch(self, mock_github_api: MagicMock) -> None:
         """Test that patch release updates minor alias but not major if not highest."""
@@ -268,6 +374,26 @@ class TestUpdateAliasTags:
         assert result["minor"] is False
         assert result["major"] is False  # Also not highest major
 
+    def test_lists_tags_once(self, mock_github_api: MagicMock) -> None:
+        """Test that the major series' tags are fetched once for both alias lookups."""
+        mock_github_api.list_tags.return_value = [make_tag("v1.2.0"), make_tag("v1.2.1")]
+        mock_github_api.tag_exists.return_value = True
+
+        result = update_alias_tags(mock_github_api, "v1.2.1", "abc123")
+
+        assert result == {"major": True, "minor": True}
+        mock_github_api.list_tag_refs.assert_called_once_with("v1.")
+
+    def test_latest_patch_trusts_caller_for_minor(self, mock_github_api: MagicMock) -> None:
+        """Test that a known latest patch moves the minor alias without a series check."""
+        mock_github_api.list_tags.return_value = [make_tag("v1.2.0"), make_tag("v1.3.0")]
+        mock_github_api.tag_exists.return_value = True
+
+        result = update_alias_tags(mock_github_api, "v1.2.1", "abc123", is_latest_patch=True)
+
+        assert result == {"major": False, "minor": True}
+        mock_github_api.update_tag.assert_called_once_with("v1.2", "abc123")
+
     def test_invalid_tag_returns_no_updates(self, mock_github_api: MagicMock) -> None:
         """Test that invalid tags don't update aliases."""
         result = update_alias_tags(mock_github_api, "invalid", "abc123")
@@ -287,6 +413,15 @@ class TestUpdateAliasTags:
         result = update_alias_tags(mock_github_api, "v1.2.0", "abc123")
         assert result == {"major": True, "minor": True}
 
+    def test_uses_provided_tags(self, mock_github_api: MagicMock) -> None:
+        """Test that a caller-supplied listing replaces the series ref lookup."""
+        tags = [make_tag("v1.2.0"), make_tag("v1.3.0"), make_tag("v2.0.0")]
+
+        result = update_alias_tags(mock_github_api, "v1.2.0", "abc123", tags=tags)
+
+        assert result == {"major": False, "minor": True}
+        mock_github_api.list_tag_refs.assert_not_called()
+
 
 class TestShouldUpdateMajorAlias:
     """Tests for should_update_major_alias() function."""
@@ -9,6 +9,11 @@ Validates: Requirements 1.1, 1.2, 1.3, 5.1, 5.2, 5.3, 5.4, 10.2, 11.1
 
 from __future__ import annotations
 
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+
 from src.branch import (
     BranchVersion,
     create_branch_pattern,
@@ -19,6 +24,9 @@ from src.branch import (
     validate_prefix,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 class TestValidateBranch:
     """Tests for validate_branch() function."""
@@ -66,6 +74,10 @@ class TestValidateBranch:
         """Test that patch version in branch name is rejected."""
         assert validate_branch("release/v1.2.3") is False
 
+    def test_invalid_trailing_newline(self) -> None:
+        """Test that a trailing newline is not accepted by the end anchor."""
+        assert validate_branch("release/v1.2\n") is False
+
     def test_invalid_empty_string(self) -> None:
         """Test that empty string is rejected."""
         assert validate_branch("") is False
@@ -74,12 +86,12 @@ class TestValidateBranch:
         """Test that whitespace-only strings are rejected."""
         assert validate_branch("   ") is False
 
-    def test_valid_branches_from_fixture(self, sample_branches: dict[str, list[str]]) -> None:
+    def test_valid_branches_from_fixture(self, sample_branches: Mapping[str, tuple[str, ...]]) -> None:
         """Test all valid branches from fixture are accepted."""
         for branch in sample_branches["valid"]:
             assert validate_branch(branch) is True, f"Expected {branch} to be valid"
 
-    def test_invalid_branches_from_fixture(self, sample_branches: dict[str, list[str]]) -> None:
+    def test_invalid_branches_from_fixture(self, sample_branches: Mapping[str, tuple[str, ...]]) -> None:
         """Test all invalid branches from fixture are rejected."""
         for branch in sample_branches["invalid"]:
             assert validate_branch(branch) is False, f"Expected {branch} to be invalid"
@@ -126,6 +138,18 @@ class TestExtractVersion:
         """Test that empty string returns None."""
         assert extract_version("") is None
 
+    def test_validate_then_extract_parses_once(self) -> None:
+        """Test that validating a branch primes the cache used by extraction."""
+        extract_version.cache_clear()
+        assert validate_branch("release/v5.6") is True
+        version = extract_version("release/v5.6")
+        assert version == BranchVersion(major=5, minor=6)
+        assert extract_version.cache_info().hits == 1
+
+    def test_extract_version_repeated_branch_reuses_result(self) -> None:
+        """Test that parsing the same branch again returns the cached result."""
+        assert extract_version("release/v3.4") is extract_version("release/v3.4")
+
 
 class TestBranchVersion:
     """Tests for BranchVersion dataclass."""
@@ -140,6 +164,19 @@ class TestBranchVersion:
         version = BranchVersion(major=0, minor=0)
         assert str(version) == "0.0"
 
+    def test_immutable_and_hashable(self) -> None:
+        """Test that BranchVersion cannot be mutated and can be hashed."""
+        version = BranchVersion(major=1, minor=2)
+        with pytest.raises(AttributeError):
+            version.major = 3  # type: ignore[misc]
+        assert hash(version) == hash(BranchVersion(major=1, minor=2))
+
+    def test_uses_slots(self) -> None:
+        """Test that BranchVersion instances carry no per-instance __dict__."""
+        version = BranchVersion(major=1, minor=2)
+        assert BranchVersion.__slots__ == ("major", "minor")
+        assert not hasattr(version, "__dict__")
+
 
 class TestValidatePrefix:
     """Tests for validate_prefix() function.
@@ -215,6 +252,16 @@ class TestValidatePrefix:
         """Test that prefix with '[' is rejected."""
         assert validate_prefix("bad[prefix") is False
 
+    def test_single_dot_is_valid(self) -> None:
+        """Test that a lone '.' is not mistaken for '..'."""
+        assert validate_prefix("pkg.v") is True
+
+    def test_warning_names_offending_character(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that the warning reports which character was rejected."""
+        with caplog.at_level(logging.WARNING):
+            assert validate_prefix("bad:pre*fix") is False
+        assert "':'" in caplog.text
+
 
 class TestCreateBranchPattern:
     """Tests for create_branch_pattern() function.
@@ -372,6 +419,13 @@ class TestParseBranch:
         assert parse_branch("") is None
         assert parse_branch("", release_prefix="v") is None
 
+    def test_mismatch_logged_at_debug_only(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a non-matching branch does not emit a warning."""
+        with caplog.at_level(logging.DEBUG, logger="src.branch"):
+            assert parse_branch("hotfix/v9.9", release_prefix="release/v") is None
+        assert "hotfix/v9.9" in caplog.text
+        assert all(record.levelno == logging.DEBUG for record in caplog.records)
+
 
 class TestShouldSkipMinorAlias:
     """Tests for should_skip_minor_alias() function.
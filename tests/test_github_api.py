@@ -1,11 +1,13 @@
 """Unit tests for github_api.py - GitHubAPI wrapper methods."""
 
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import ANY, MagicMock, PropertyMock, patch
 
 import pytest
 from github.GithubException import GithubException
+from github.Requester import Requester
 
-from src.github_api import GitHubAPI
+from src.github_api import GitHubAPI, TagRef
 
 
 class TestGitHubAPIInit:
@@ -17,9 +19,14 @@ class TestGitHubAPIInit:
             mock_repo = MagicMock()
             mock_github.return_value.get_repo.return_value = mock_repo
 
-            GitHubAPI(token="test-token", repository="owner/repo")
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+
+            mock_github.assert_called_once_with(auth=ANY, per_page=100, lazy=True)
+            assert mock_github.call_args.kwargs["auth"].token == "test-token"
+            mock_github.return_value.get_repo.assert_not_called()
 
-            mock_github.assert_called_once_with("test-token")
+            api.tag_exists("v1.0.0")
+            api.tag_exists("v1.0.1")
             mock_github.return_value.get_repo.assert_called_once_with("owner/repo")
 
     def test_init_with_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -31,9 +38,11 @@ class TestGitHubAPIInit:
             mock_repo = MagicMock()
             mock_github.return_value.get_repo.return_value = mock_repo
 
-            GitHubAPI()
+            api = GitHubAPI()
 
-            mock_github.assert_called_once_with("env-token")
+            mock_github.assert_called_once_with(auth=ANY, per_page=100, lazy=True)
+            assert mock_github.call_args.kwargs["auth"].token == "env-token"
+            api.tag_exists("v1.0.0")
             mock_github.return_value.get_repo.assert_called_once_with("env-owner/env-repo")
 
     def test_init_missing_token_raises_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -53,35 +62,206 @@ class TestGitHubAPIInit:
             GitHubAPI()
 
 
+def _tags_page(nodes: list[dict[str, Any]], end_cursor: str | None = None) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Build a GraphQL response page for the tag listing query.
+
+    Args:
+        nodes: Ref nodes with 'name' and 'target' entries.
+        end_cursor: Cursor of the next page, or None for the last page.
+    """
+    page_info = {"hasNextPage": end_cursor is not None, "endCursor": end_cursor}
+    return {}, {"data": {"repository": {"refs": {"nodes": nodes, "pageInfo": page_info}}}}
+
+
+def _tag_node(name: str, commit_sha: str) -> dict[str, Any]:
+    """Build a lightweight tag ref node pointing directly at a commit."""
+    return {"name": name, "target": {"__typename": "Commit", "oid": commit_sha}}
+
+
+def _annotated_tag_node(name: str, tag_sha: str, target: dict[str, Any]) -> dict[str, Any]:
+    """Build an annotated tag ref node whose tag object points at ``target``."""
+    return {"name": name, "target": {"__typename": "Tag", "oid": tag_sha, "target": target}}
+
+
 class TestListTags:
     """Tests for GitHubAPI.list_tags method."""
 
     def test_list_tags_returns_all_tags(self) -> None:
-        """list_tags returns all repository tags."""
+        """list_tags follows every page and dereferences annotated tags."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_github.return_value.get_repo.return_value = MagicMock()
+            requester = mock_github.return_value.requester
+            requester.graphql_query.side_effect = [
+                _tags_page([_tag_node("v1.0.0", "sha-1")], end_cursor="cursor-1"),
+                _tags_page([_annotated_tag_node("v1.0.1", "tag-sha", {"__typename": "Commit", "oid": "sha-2"})]),
+            ]
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+            result = api.list_tags()
+
+            assert result == [TagRef("v1.0.0", "sha-1"), TagRef("v1.0.1", "sha-2")]
+            assert requester.graphql_query.call_count == 2
+            first_vars = requester.graphql_query.call_args_list[0].args[1]
+            second_vars = requester.graphql_query.call_args_list[1].args[1]
+            assert first_vars == {"owner": "owner", "name": "repo", "cursor": None}
+            assert second_vars["cursor"] == "cursor-1"
+
+    def test_list_tags_follows_tag_of_tag(self) -> None:
+        """list_tags peels nested annotated tags until it reaches the commit."""
         with patch("src.github_api.Github") as mock_github:
             mock_repo = MagicMock()
-            mock_tags = [MagicMock(name="v1.0.0"), MagicMock(name="v1.0.1")]
-            mock_repo.get_tags.return_value = mock_tags
+            mock_repo.get_git_tag.side_effect = lambda sha: {
+                "inner-tag-sha": MagicMock(object=MagicMock(type="tag", sha="innermost-tag-sha")),
+                "innermost-tag-sha": MagicMock(object=MagicMock(type="commit", sha="sha-1")),
+            }[sha]
             mock_github.return_value.get_repo.return_value = mock_repo
+            mock_github.return_value.requester.graphql_query.return_value = _tags_page(
+                [_annotated_tag_node("v1.0.0", "outer-tag-sha", {"__typename": "Tag", "oid": "inner-tag-sha"})]
+            )
 
             api = GitHubAPI(token="test-token", repository="owner/repo")
             result = api.list_tags()
 
-            assert result == mock_tags
-            mock_repo.get_tags.assert_called_once()
+            assert result == [TagRef("v1.0.0", "sha-1")]
+            assert mock_repo.get_git_tag.call_count == 2
 
     def test_list_tags_empty_repository(self) -> None:
         """list_tags returns empty list for repository with no tags."""
         with patch("src.github_api.Github") as mock_github:
-            mock_repo = MagicMock()
-            mock_repo.get_tags.return_value = []
-            mock_github.return_value.get_repo.return_value = mock_repo
+            mock_github.return_value.get_repo.return_value = MagicMock()
+            mock_github.return_value.requester.graphql_query.return_value = _tags_page([])
 
             api = GitHubAPI(token="test-token", repository="owner/repo")
             result = api.list_tags()
 
             assert result == []
 
+    def test_iter_tags_fetches_lazily(self) -> None:
+        """iter_tags stops requesting pages once the caller stops iterating."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_github.return_value.get_repo.return_value = MagicMock()
+            requester = mock_github.return_value.requester
+            requester.graphql_query.side_effect = [
+                _tags_page([_tag_node("v1.0.0", "sha-1")], end_cursor="cursor-1"),
+                _tags_page([_tag_node("v1.0.1", "sha-2")]),
+            ]
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+            assert next(api.iter_tags()) == TagRef("v1.0.0", "sha-1")
+            requester.graphql_query.assert_called_once()
+
+    def test_list_tags_reuses_listing(self) -> None:
+        """list_tags fetches once and returns independent copies afterwards."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_github.return_value.get_repo.return_value = MagicMock()
+            requester = mock_github.return_value.requester
+            requester.graphql_query.return_value = _tags_page([_tag_node("v1.0.0", "sha-1")])
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+            first = api.list_tags()
+            first.clear()
+
+            assert api.list_tags() == [TagRef("v1.0.0", "sha-1")]
+            assert list(api.iter_tags()) == [TagRef("v1.0.0", "sha-1")]
+            requester.graphql_query.assert_called_once()
+
+    def test_partial_scan_does_not_cache(self) -> None:
+        """A scan that stops early leaves the listing to be fetched again."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_github.return_value.get_repo.return_value = MagicMock()
+            requester = mock_github.return_value.requester
+            requester.graphql_query.return_value = _tags_page(
+                [_tag_node("v1.0.0", "sha-1"), _tag_node("v1.0.1", "sha-2")]
+            )
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+            next(api.iter_tags())
+
+            assert [tag.name for tag in api.list_tags()] == ["v1.0.0", "v1.0.1"]
+            assert requester.graphql_query.call_count == 2
+
+    def test_tag_changes_invalidate_listing(self) -> None:
+        """Creating, moving or refreshing tags forces the next listing to refetch."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_github.return_value.get_repo.return_value = mock_repo
+            empty_page = {"nodes": [], "pageInfo": {"hasNextPage": False, "endCursor": None}}
+            list_tags_query = patch.object(GitHubAPI, "_list_tags_page", return_value=empty_page)
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+            with list_tags_query as fetch_page:
+                api.list_tags()
+                api.create_tag("v1.0.1", "commit-sha")
+                api.list_tags()
+                api.update_tag("v1", "commit-sha")
+                api.list_tags()
+                api.refresh_tags()
+                api.list_tags()
+
+            assert fetch_page.call_count == 4
+
+
+class TestIsAncestor:
+    """Tests for GitHubAPI.is_ancestor method."""
+
+    def test_is_ancestor_when_branch_contains_commit(self) -> None:
+        """is_ancestor is True when the branch is identical to or ahead of the commit."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+
+            for status in ("identical", "ahead"):
+                mock_repo.compare.return_value = MagicMock(status=status)
+                assert api.is_ancestor("release/v1.0", "commit-sha") is True
+
+            mock_repo.compare.assert_called_with("commit-sha", "release/v1.0")
+            mock_repo.get_commits.assert_not_called()
+
+    def test_is_ancestor_when_branch_lacks_commit(self) -> None:
+        """is_ancestor is False when the branch is behind or diverged from the commit."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+
+            for status in ("behind", "diverged"):
+                mock_repo.compare.return_value = MagicMock(status=status)
+                assert api.is_ancestor("release/v1.0", "commit-sha") is False
+
+
+class TestListTagRefs:
+    """Tests for GitHubAPI.list_tag_refs method."""
+
+    def test_list_tag_refs_filters_by_prefix(self) -> None:
+        """list_tag_refs queries matching refs and strips the ref namespace."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_repo.get_git_matching_refs.return_value = [
+                MagicMock(ref="refs/tags/v1.2.0"),
+                MagicMock(ref="refs/tags/v1.2.1"),
+            ]
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+            result = api.list_tag_refs("v1.")
+
+            assert result == ["v1.2.0", "v1.2.1"]
+            mock_repo.get_git_matching_refs.assert_called_once_with("tags/v1.")
+
+    def test_list_tag_refs_no_matches(self) -> None:
+        """list_tag_refs returns empty list when no tags match."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_repo.get_git_matching_refs.return_value = []
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+
+            assert api.list_tag_refs("v9.") == []
+
 
 class TestCreateTag:
     """Tests for GitHubAPI.create_tag method."""
@@ -134,21 +314,24 @@ class TestCreateTag:
         """create_tag raises GithubException on API failure."""
         with patch("src.github_api.Github") as mock_github:
             mock_repo = MagicMock()
-            # Tag doesn't exist yet
             mock_repo.get_git_ref.side_effect = GithubException(404, "Not found", None)
             mock_repo.create_git_tag.side_effect = GithubException(422, "Tag exists", None)
             mock_github.return_value.get_repo.return_value = mock_repo
 
             api = GitHubAPI(token="test-token", repository="owner/repo")
 
-            with pytest.raises(GithubException):
+            with pytest.raises(GithubException) as exc_info:
                 api.create_tag("v1.0.0", "commit-sha-456")
 
+            assert exc_info.value.status == 422
+            mock_repo.create_git_tag.assert_called_once()
+
     def test_create_tag_idempotent_same_commit(self) -> None:
         """create_tag is idempotent when tag exists pointing to same commit."""
         with patch("src.github_api.Github") as mock_github:
             mock_repo = MagicMock()
             # Tag already exists pointing to same commit (lightweight tag)
+            mock_repo.create_git_ref.side_effect = GithubException(422, "Reference already exists", None)
             mock_ref = MagicMock()
             mock_ref.object.sha = "commit-sha-456"
             mock_ref.object.type = "commit"
@@ -156,10 +339,26 @@ class TestCreateTag:
             mock_github.return_value.get_repo.return_value = mock_repo
 
             api = GitHubAPI(token="test-token", repository="owner/repo")
-            # Should not raise, should be a no-op
+            # Should not raise, the rerun finds the tag on the same commit
             api.create_tag("v1.0.0", "commit-sha-456", "Release message")
 
-            # Should not attempt to create tag or ref
+            mock_repo.get_git_ref.assert_called_once_with("tags/v1.0.0")
+            mock_repo.create_git_tag.assert_not_called()
+
+    def test_create_tag_rerun_uses_cached_listing(self) -> None:
+        """create_tag answers a rerun from the cached listing without writing a tag object."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_github.return_value.requester.graphql_query.return_value = _tags_page(
+                [_tag_node("v1.0.0", "commit-sha-456")]
+            )
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+            api.list_tags()
+            api.create_tag("v1.0.0", "commit-sha-456", "Release message")
+
+            mock_repo.get_git_ref.assert_not_called()
             mock_repo.create_git_tag.assert_not_called()
             mock_repo.create_git_ref.assert_not_called()
 
@@ -168,6 +367,7 @@ class TestCreateTag:
         with patch("src.github_api.Github") as mock_github:
             mock_repo = MagicMock()
             # Tag already exists pointing to different commit
+            mock_repo.create_git_ref.side_effect = GithubException(422, "Reference already exists", None)
             mock_ref = MagicMock()
             mock_ref.object.sha = "different-commit-sha"
             mock_ref.object.type = "commit"
@@ -181,66 +381,69 @@ class TestCreateTag:
 
             assert exc_info.value.status == 409
             assert "already exists pointing to different commit" in str(exc_info.value.data)
+            mock_repo.create_git_tag.assert_not_called()
 
-
-class TestUpdateTag:
-    """Tests for GitHubAPI.update_tag method."""
-
-    def test_update_tag_force_pushes(self) -> None:
-        """update_tag force-pushes tag to new commit."""
+    def test_create_tag_conflict_bypasses_stale_listing(self) -> None:
+        """create_tag resolves a conflict from the ref even if the cached listing missed it."""
         with patch("src.github_api.Github") as mock_github:
             mock_repo = MagicMock()
+            mock_github.return_value.requester.graphql_query.return_value = _tags_page([])
+            mock_repo.create_git_ref.side_effect = GithubException(422, "Reference already exists", None)
             mock_ref = MagicMock()
+            mock_ref.object.sha = "commit-sha-456"
+            mock_ref.object.type = "commit"
             mock_repo.get_git_ref.return_value = mock_ref
             mock_github.return_value.get_repo.return_value = mock_repo
 
             api = GitHubAPI(token="test-token", repository="owner/repo")
-            api.update_tag("v1", "new-commit-sha")
+            api.list_tags()
+            api.create_tag("v1.0.0", "commit-sha-456", "Release message")
 
-            mock_repo.get_git_ref.assert_called_once_with("tags/v1")
-            mock_ref.edit.assert_called_once_with(sha="new-commit-sha", force=True)
+            mock_repo.get_git_ref.assert_called_once_with("tags/v1.0.0")
 
-    def test_update_tag_nonexistent_tag(self) -> None:
-        """update_tag raises GithubException for nonexistent tag."""
+    def test_create_tag_conflict_without_ref_reraises(self) -> None:
+        """create_tag re-raises a creation conflict it cannot resolve."""
         with patch("src.github_api.Github") as mock_github:
             mock_repo = MagicMock()
-            mock_repo.get_git_ref.side_effect = GithubException(404, "Not Found", None)
+            mock_repo.create_git_ref.side_effect = GithubException(422, "Invalid ref", None)
+            mock_repo.get_git_ref.side_effect = GithubException(404, "Not found", None)
             mock_github.return_value.get_repo.return_value = mock_repo
 
             api = GitHubAPI(token="test-token", repository="owner/repo")
 
-            with pytest.raises(GithubException):
-                api.update_tag("nonexistent", "commit-sha")
+            with pytest.raises(GithubException) as exc_info:
+                api.create_tag("v1.0.0", "commit-sha-456")
 
+            assert exc_info.value.status == 422
 
-class TestGetBranchCommits:
-    """Tests for GitHubAPI.get_branch_commits method."""
 
-    def test_get_branch_commits_returns_commits(self) -> None:
-        """get_branch_commits returns list of commits from branch."""
-        with patch("src.github_api.Github") as mock_github:
-            mock_repo = MagicMock()
-            mock_commits = [MagicMock(sha="abc123"), MagicMock(sha="def456")]
-            mock_repo.get_commits.return_value = mock_commits
-            mock_github.return_value.get_repo.return_value = mock_repo
+class TestUpdateTag:
+    """Tests for GitHubAPI.update_tag method."""
 
+    def test_update_tag_force_pushes(self) -> None:
+        """update_tag force-pushes the tag with one PATCH to the refs endpoint."""
+        with patch.object(Requester, "requestJsonAndCheck", return_value=({}, {})) as request:
             api = GitHubAPI(token="test-token", repository="owner/repo")
-            result = api.get_branch_commits("release/v1.0")
-
-            assert result == mock_commits
-            mock_repo.get_commits.assert_called_once_with(sha="release/v1.0")
+            api.update_tag("v1", "new-commit-sha")
 
-    def test_get_branch_commits_nonexistent_branch(self) -> None:
-        """get_branch_commits raises GithubException for nonexistent branch."""
-        with patch("src.github_api.Github") as mock_github:
-            mock_repo = MagicMock()
-            mock_repo.get_commits.side_effect = GithubException(404, "Branch not found", None)
-            mock_github.return_value.get_repo.return_value = mock_repo
+            request.assert_called_once_with(
+                "PATCH",
+                "/repos/owner/repo/git/refs/tags/v1",
+                input={"sha": "new-commit-sha", "force": True},
+            )
 
+    def test_update_tag_nonexistent_tag(self) -> None:
+        """update_tag raises GithubException for nonexistent tag."""
+        with patch.object(
+            Requester,
+            "requestJsonAndCheck",
+            side_effect=GithubException(422, {"message": "Reference does not exist"}, None),
+        ):
             api = GitHubAPI(token="test-token", repository="owner/repo")
 
-            with pytest.raises(GithubException):
-                api.get_branch_commits("nonexistent/branch")
+            with pytest.raises(GithubException) as exc_info:
+                api.update_tag("nonexistent", "commit-sha")
+            assert exc_info.value.status == 422
 
 
 class TestTagExists:
@@ -271,6 +474,48 @@ class TestTagExists:
 
             assert result is False
 
+    def test_tag_exists_fetches_lazy_ref(self) -> None:
+        """tag_exists reports a missing tag when the lazy ref's fetch returns 404."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_ref = MagicMock()
+            type(mock_ref).object = PropertyMock(side_effect=GithubException(404, "Not Found", None))
+            mock_repo.get_git_ref.return_value = mock_ref
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+
+            assert api.tag_exists("nonexistent") is False
+
+    def test_tag_exists_reraises_non_404_errors(self) -> None:
+        """tag_exists propagates errors that do not mean the tag is missing."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_repo.get_git_ref.side_effect = GithubException(403, "API rate limit exceeded", None)
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+
+            with pytest.raises(GithubException) as exc_info:
+                api.tag_exists("v1.0.0")
+            assert exc_info.value.status == 403
+
+    def test_tag_exists_uses_cached_listing(self) -> None:
+        """tag_exists answers from a cached listing without probing refs."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_github.return_value.requester.graphql_query.return_value = _tags_page(
+                [_tag_node("v1.0.0", "commit-sha-123")]
+            )
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+            api.list_tags()
+
+            assert api.tag_exists("v1.0.0") is True
+            assert api.tag_exists("v2.0.0") is False
+            mock_repo.get_git_ref.assert_not_called()
+
 
 class TestGetTagCommitSha:
     """Tests for GitHubAPI.get_tag_commit_sha method."""
@@ -320,3 +565,33 @@ class TestGetTagCommitSha:
             result = api.get_tag_commit_sha("nonexistent")
 
             assert result is None
+
+    def test_get_tag_commit_sha_reraises_non_404_errors(self) -> None:
+        """get_tag_commit_sha propagates errors that do not mean the tag is missing."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_repo.get_git_ref.side_effect = GithubException(502, "Bad Gateway", None)
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+
+            with pytest.raises(GithubException) as exc_info:
+                api.get_tag_commit_sha("v1.0.0")
+            assert exc_info.value.status == 502
+
+    def test_get_tag_commit_sha_uses_cached_listing(self) -> None:
+        """get_tag_commit_sha reads the listed commit without probing refs."""
+        with patch("src.github_api.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_github.return_value.requester.graphql_query.return_value = _tags_page(
+                [_tag_node("v1.0.0", "commit-sha-123")]
+            )
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            api = GitHubAPI(token="test-token", repository="owner/repo")
+            api.list_tags()
+
+            assert api.get_tag_commit_sha("v1.0.0") == "commit-sha-123"
+            assert api.get_tag_commit_sha("v2.0.0") is None
+            mock_repo.get_git_ref.assert_not_called()
+            mock_repo.get_git_tag.assert_not_called()
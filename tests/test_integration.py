@@ -25,7 +25,7 @@ from src.main import (
     handle_tag_push,
     handle_workflow_dispatch,
 )
-from tests.conftest import make_commit, make_tag
+from tests.conftest import alias_updates, make_commit, make_tag
 
 if TYPE_CHECKING:
     pass
@@ -297,7 +297,7 @@ class TestGATransitionFlow:
         mock_github_api.tag_exists.return_value = True
 
         # Mock branch commits to include the tag's commit
-        mock_github_api.get_branch_commits.return_value = [
+        mock_github_api.branch_commits.return_value = [
             make_commit("ga_commit_sha"),
         ]
 
@@ -327,7 +327,7 @@ class TestGATransitionFlow:
         """
         mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
         mock_github_api.tag_exists.return_value = False  # Aliases don't exist yet
-        mock_github_api.get_branch_commits.return_value = [
+        mock_github_api.branch_commits.return_value = [
             make_commit("ga_commit_sha"),
         ]
 
@@ -349,8 +349,7 @@ class TestGATransitionFlow:
         handle_tag_push(mock_github_api, context, inputs)
 
         # Should create both v1 and v1.2 alias tags
-        create_calls = mock_github_api.create_tag.call_args_list
-        alias_tags_created = [call[0][0] for call in create_calls]
+        alias_tags_created = alias_updates(mock_github_api)
         assert "v1.2" in alias_tags_created
         assert "v1" in alias_tags_created
 
@@ -361,7 +360,7 @@ class TestGATransitionFlow:
         """
         mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
         mock_github_api.tag_exists.return_value = True  # Aliases exist
-        mock_github_api.get_branch_commits.return_value = [
+        mock_github_api.branch_commits.return_value = [
             make_commit("ga_commit_sha"),
         ]
 
@@ -383,14 +382,14 @@ class TestGATransitionFlow:
         handle_tag_push(mock_github_api, context, inputs)
 
         # Should update both v1 and v1.2 alias tags
-        assert mock_github_api.update_tag.call_count == 2
+        assert alias_updates(mock_github_api) == {"v1": "ga_commit_sha", "v1.2": "ga_commit_sha"}
 
     def test_invalid_ga_tag_location_fails(self, mock_github_api: MagicMock) -> None:
         """Test that GA tag not on release branch fails.
 
         Validates: Requirement 5.2
         """
-        mock_github_api.get_branch_commits.return_value = [
+        mock_github_api.branch_commits.return_value = [
             make_commit("other_commit"),
         ]
 
@@ -547,7 +546,7 @@ class TestPatchProgressionFlow:
         handle_commit_push(mock_github_api, context, inputs)
 
         # Should update alias tags
-        assert mock_github_api.update_tag.call_count >= 1
+        assert alias_updates(mock_github_api) == {"v1": "patch_commit", "v1.2": "patch_commit"}
 
     def test_patch_progression_ignores_other_branches(self, mock_github_api: MagicMock) -> None:
         """Test that patch progression only considers tags for the current branch."""
@@ -679,7 +678,7 @@ class TestMultiBranchAliasUpdates:
         Validates: Requirement 7.3
         """
         mock_github_api.tag_exists.return_value = True
-        mock_github_api.get_branch_commits.return_value = [
+        mock_github_api.branch_commits.return_value = [
             make_commit("highest_commit"),
         ]
 
@@ -710,8 +709,7 @@ class TestMultiBranchAliasUpdates:
         handle_tag_push(mock_github_api, context, inputs)
 
         # v1 alias should be updated (v1.2.0 is highest)
-        update_calls = mock_github_api.update_tag.call_args_list
-        updated_tags = [call[0][0] for call in update_calls]
+        updated_tags = alias_updates(mock_github_api)
         assert "v1" in updated_tags
 
     def test_lower_branch_release_does_not_update_major_alias(self, mock_github_api: MagicMock) -> None:
@@ -720,7 +718,7 @@ class TestMultiBranchAliasUpdates:
         Validates: Requirement 7.3
         """
         mock_github_api.tag_exists.return_value = True
-        mock_github_api.get_branch_commits.return_value = [
+        mock_github_api.branch_commits.return_value = [
             make_commit("lower_commit"),
         ]
 
@@ -750,8 +748,7 @@ class TestMultiBranchAliasUpdates:
         handle_tag_push(mock_github_api, context, inputs)
 
         # v1.1 alias should be updated, but v1 should NOT be updated
-        update_calls = mock_github_api.update_tag.call_args_list
-        updated_tags = [call[0][0] for call in update_calls]
+        updated_tags = alias_updates(mock_github_api)
         assert "v1.1" in updated_tags
         assert "v1" not in updated_tags
 
@@ -761,7 +758,7 @@ class TestMultiBranchAliasUpdates:
         Validates: Requirement 7.3
         """
         mock_github_api.tag_exists.return_value = False  # New aliases
-        mock_github_api.get_branch_commits.return_value = [
+        mock_github_api.branch_commits.return_value = [
             make_commit("new_minor_commit"),
         ]
 
@@ -790,8 +787,7 @@ class TestMultiBranchAliasUpdates:
         handle_tag_push(mock_github_api, context, inputs)
 
         # Both v1 and v1.3 aliases should be created
-        create_calls = mock_github_api.create_tag.call_args_list
-        created_tags = [call[0][0] for call in create_calls]
+        created_tags = alias_updates(mock_github_api)
         assert "v1" in created_tags
         assert "v1.3" in created_tags
 
@@ -1050,7 +1046,7 @@ class TestMainEntryPoint:
         monkeypatch.setenv("GITHUB_OUTPUT", output_file)
 
         mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
-        mock_github_api.get_branch_commits.return_value = [make_commit("ga_commit")]
+        mock_github_api.branch_commits.return_value = [make_commit("ga_commit")]
         mock_github_api.tag_exists.return_value = False
 
         with patch("src.main.GitHubAPI", return_value=mock_github_api):
@@ -1133,11 +1129,13 @@ class TestMainEntryPoint:
             output_file = f.name
         monkeypatch.setenv("GITHUB_OUTPUT", output_file)
 
-        with patch("src.main.GitHubAPI", return_value=mock_github_api):
+        with patch("src.main.GitHubAPI", return_value=mock_github_api) as mock_api_class:
             from src.main import main
 
             main()
 
+        # Unhandled events never construct the API client
+        mock_api_class.assert_not_called()
         with open(output_file) as f:
             content = f.read()
         assert "tag-type=skipped" in content
@@ -1334,7 +1332,7 @@ class TestMainCoverageGaps:
         This covers lines 278-279 - dry-run GA tag handling.
         """
         mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
-        mock_github_api.get_branch_commits.return_value = [make_commit("ga_commit")]
+        mock_github_api.branch_commits.return_value = [make_commit("ga_commit")]
 
         context = GitHubContext(
             event_name="push",
@@ -1364,7 +1362,7 @@ class TestMainCoverageGaps:
         This covers lines 300-301 - dry-run patch tag handling.
         """
         mock_github_api.list_tags.return_value = [make_tag("v1.2.0"), make_tag("v1.2.1")]
-        mock_github_api.get_branch_commits.return_value = [make_commit("patch_commit")]
+        mock_github_api.branch_commits.return_value = [make_commit("patch_commit")]
 
         context = GitHubContext(
             event_name="push",
@@ -1414,7 +1412,7 @@ class TestMainCoverageGaps:
 
         This covers line 368 - exception handling in _validate_tag_on_branch.
         """
-        mock_github_api.get_branch_commits.side_effect = Exception("API error")
+        mock_github_api.branch_commits.side_effect = Exception("API error")
 
         from src.main import _validate_tag_on_branch
 
@@ -1424,7 +1422,7 @@ class TestMainCoverageGaps:
 
     def test_handle_tag_push_rc_tag(self, mock_github_api: MagicMock) -> None:
         """Test handle_tag_push with RC tag (no alias updates)."""
-        mock_github_api.get_branch_commits.return_value = [make_commit("rc_commit")]
+        mock_github_api.branch_commits.return_value = [make_commit("rc_commit")]
 
         context = GitHubContext(
             event_name="push",
@@ -1562,6 +1560,20 @@ class TestMainCoverageGaps:
 
         assert result is None
 
+    def test_commit_has_version_tag_ignores_aliases(self, mock_github_api: MagicMock) -> None:
+        """Test _commit_has_version_tag skips alias tags on the same commit."""
+        from src.main import _commit_has_version_tag
+
+        mock_github_api.list_tags.return_value = [
+            make_tag("v1", commit_sha="target_commit"),
+            make_tag("v1.2", commit_sha="target_commit"),
+            make_tag("v1.2.1", commit_sha="target_commit"),
+        ]
+
+        result = _commit_has_version_tag(mock_github_api, "target_commit", "v")
+
+        assert result == "v1.2.1"
+
     """Integration tests for configurable release and tag prefixes.
 
     Validates: Requirements 5.6, 10.2
@@ -1674,7 +1686,7 @@ class TestMainCoverageGaps:
         """
         mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
         mock_github_api.tag_exists.return_value = False
-        mock_github_api.get_branch_commits.return_value = [make_commit("ga_commit")]
+        mock_github_api.branch_commits.return_value = [make_commit("ga_commit")]
 
         context = GitHubContext(
             event_name="push",
@@ -1698,8 +1710,7 @@ class TestMainCoverageGaps:
         assert outputs.tag == "v1.2.0"
         assert outputs.tag_type == "ga"
         # Both v1 and v1.2 aliases should be created
-        create_calls = mock_github_api.create_tag.call_args_list
-        alias_tags_created = [call[0][0] for call in create_calls]
+        alias_tags_created = alias_updates(mock_github_api)
         assert "v1" in alias_tags_created
         assert "v1.2" in alias_tags_created
 
@@ -1781,7 +1792,7 @@ class TestMainCoverageGaps:
         """
         mock_github_api.list_tags.return_value = [make_tag("v1.2.0")]
         mock_github_api.tag_exists.return_value = False
-        mock_github_api.get_branch_commits.return_value = [make_commit("ga_commit")]
+        mock_github_api.branch_commits.return_value = [make_commit("ga_commit")]
 
         context = GitHubContext(
             event_name="push",
@@ -1805,8 +1816,7 @@ class TestMainCoverageGaps:
         assert outputs.tag == "v1.2.0"
         assert outputs.tag_type == "ga"
         # Only v1 alias should be created, v1.2 should be skipped
-        create_calls = mock_github_api.create_tag.call_args_list
-        alias_tags_created = [call[0][0] for call in create_calls]
+        alias_tags_created = alias_updates(mock_github_api)
         assert "v1" in alias_tags_created
         assert "v1.2" not in alias_tags_created
 
@@ -1915,7 +1925,7 @@ class TestMainCoverageGaps:
         """
         mock_github_api.list_tags.return_value = [make_tag("pkg-1.2.0")]
         mock_github_api.tag_exists.return_value = False
-        mock_github_api.get_branch_commits.return_value = [make_commit("ga_commit")]
+        mock_github_api.branch_commits.return_value = [make_commit("ga_commit")]
 
         context = GitHubContext(
             event_name="push",
@@ -1939,8 +1949,7 @@ class TestMainCoverageGaps:
         assert outputs.tag == "pkg-1.2.0"
         assert outputs.tag_type == "ga"
         # Only pkg-1 alias should be created, pkg-1.2 should be skipped
-        create_calls = mock_github_api.create_tag.call_args_list
-        alias_tags_created = [call[0][0] for call in create_calls]
+        alias_tags_created = alias_updates(mock_github_api)
         assert "pkg-1" in alias_tags_created
         assert "pkg-1.2" not in alias_tags_created
 
@@ -2021,7 +2030,7 @@ class TestMainCoverageGaps:
         """
         mock_github_api.list_tags.return_value = [make_tag("api-1.2.0")]
         mock_github_api.tag_exists.return_value = False
-        mock_github_api.get_branch_commits.return_value = [make_commit("ga_commit")]
+        mock_github_api.branch_commits.return_value = [make_commit("ga_commit")]
 
         context = GitHubContext(
             event_name="push",
@@ -2045,8 +2054,7 @@ class TestMainCoverageGaps:
         assert outputs.tag == "api-1.2.0"
         assert outputs.tag_type == "ga"
         # Both api-1 and api-1.2 aliases should be created
-        create_calls = mock_github_api.create_tag.call_args_list
-        alias_tags_created = [call[0][0] for call in create_calls]
+        alias_tags_created = alias_updates(mock_github_api)
         assert "api-1" in alias_tags_created
         assert "api-1.2" in alias_tags_created
 
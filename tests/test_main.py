@@ -22,7 +22,7 @@ from src.main import (
     handle_tag_push,
     parse_inputs,
 )
-from tests.conftest import make_commit, make_tag
+from tests.conftest import alias_updates, make_commit, make_tag
 
 if TYPE_CHECKING:
     pass
@@ -105,6 +105,22 @@ class TestParseInputsPrefixes:
         assert exc_info.value.code == 1
 
 
+class TestParseInputsToken:
+    """Tests for parse_inputs() token resolution."""
+
+    def test_input_token_preferred(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that INPUT_TOKEN takes precedence over GITHUB_TOKEN."""
+        monkeypatch.setenv("INPUT_TOKEN", "input-token")
+        monkeypatch.setenv("GITHUB_TOKEN", "github-token")
+        assert parse_inputs([]).token == "input-token"
+
+    def test_empty_input_token_falls_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an empty INPUT_TOKEN falls back to GITHUB_TOKEN."""
+        monkeypatch.setenv("INPUT_TOKEN", "")
+        monkeypatch.setenv("GITHUB_TOKEN", "github-token")
+        assert parse_inputs([]).token == "github-token"
+
+
 class TestTagCreationWithCustomPrefixes:
     """Tests for tag creation with custom prefixes.
 
@@ -281,7 +297,7 @@ class TestAliasSkipLogic:
         """Test that minor alias is skipped when release_prefix == tag_prefix."""
         mock_github_api.list_tags.return_value = [make_tag("v1.0.0")]
         mock_github_api.tag_exists.return_value = True  # GA exists
-        mock_github_api.get_branch_commits.return_value = [make_commit("ga_sha")]
+        mock_github_api.branch_commits.return_value = [make_commit("ga_sha")]
 
         context = GitHubContext(
             event_name="push",
@@ -303,8 +319,7 @@ class TestAliasSkipLogic:
         handle_tag_push(mock_github_api, context, inputs)
 
         # Should only update major alias (v1), not minor alias (v1.0)
-        update_calls = mock_github_api.update_tag.call_args_list
-        updated_tags = [call[0][0] for call in update_calls]
+        updated_tags = alias_updates(mock_github_api)
         assert "v1" in updated_tags
         assert "v1.0" not in updated_tags
 
@@ -312,7 +327,7 @@ class TestAliasSkipLogic:
         """Test that both aliases are created when prefixes differ."""
         mock_github_api.list_tags.return_value = [make_tag("v1.0.0")]
         mock_github_api.tag_exists.return_value = False  # Aliases don't exist
-        mock_github_api.get_branch_commits.return_value = [make_commit("ga_sha")]
+        mock_github_api.branch_commits.return_value = [make_commit("ga_sha")]
 
         context = GitHubContext(
             event_name="push",
@@ -334,8 +349,7 @@ class TestAliasSkipLogic:
         handle_tag_push(mock_github_api, context, inputs)
 
         # Should create both aliases
-        create_calls = mock_github_api.create_tag.call_args_list
-        created_tags = [call[0][0] for call in create_calls]
+        created_tags = alias_updates(mock_github_api)
         assert "v1" in created_tags
         assert "v1.0" in created_tags
 
@@ -367,15 +381,47 @@ class TestAliasSkipLogic:
         handle_commit_push(mock_github_api, context, inputs)
 
         # Check that minor alias (pkg-1.0) was NOT updated
-        update_calls = mock_github_api.update_tag.call_args_list
-        updated_tags = [call[0][0] for call in update_calls]
+        updated_tags = alias_updates(mock_github_api)
         assert "pkg-1.0" not in updated_tags
 
+    def test_patch_release_lists_tags_once(self, mock_github_api: MagicMock) -> None:
+        """Test that a patch release shares one tag listing across every scan."""
+        mock_github_api.list_tags.return_value = [
+            make_tag("v1.0.0"),
+            make_tag("v1.0.1"),
+        ]
+        mock_github_api.tag_exists.return_value = True
+
+        context = GitHubContext(
+            event_name="push",
+            ref_name="release/v1.0",
+            ref_type="branch",
+            sha="patch_sha",
+            repository="owner/repo",
+        )
+        inputs = ActionInputs(
+            token="test-token",
+            debug=False,
+            dry_run=False,
+            target_branch="",
+            aliases=True,
+            release_prefix="release/v",
+            tag_prefix="v",
+        )
+
+        outputs = handle_commit_push(mock_github_api, context, inputs)
+
+        assert outputs.tag == "v1.0.2"
+        mock_github_api.list_tags.assert_called_once()
+        mock_github_api.iter_tags.assert_not_called()
+        mock_github_api.list_tag_refs.assert_not_called()
+        assert alias_updates(mock_github_api) == {"v1": "patch_sha", "v1.0": "patch_sha"}
+
     def test_major_alias_always_created(self, mock_github_api: MagicMock) -> None:
         """Test that major alias is always created regardless of prefix match."""
         mock_github_api.list_tags.return_value = [make_tag("v2.0.0")]
         mock_github_api.tag_exists.return_value = False
-        mock_github_api.get_branch_commits.return_value = [make_commit("ga_sha")]
+        mock_github_api.branch_commits.return_value = [make_commit("ga_sha")]
 
         context = GitHubContext(
             event_name="push",
@@ -397,8 +443,7 @@ class TestAliasSkipLogic:
         handle_tag_push(mock_github_api, context, inputs)
 
         # Major alias (v2) should be created
-        create_calls = mock_github_api.create_tag.call_args_list
-        created_tags = [call[0][0] for call in create_calls]
+        created_tags = alias_updates(mock_github_api)
         assert "v2" in created_tags
 
 
@@ -411,7 +456,7 @@ class TestTagPushWithCustomPrefixes:
     def test_tag_push_validates_with_custom_prefix(self, mock_github_api: MagicMock) -> None:
         """Test tag push validates tag with custom prefix."""
         mock_github_api.list_tags.return_value = [make_tag("pkg-v1.0.0")]
-        mock_github_api.get_branch_commits.return_value = [make_commit("tag_sha")]
+        mock_github_api.branch_commits.return_value = [make_commit("tag_sha")]
 
         context = GitHubContext(
             event_name="push",
@@ -438,7 +483,7 @@ class TestTagPushWithCustomPrefixes:
 
     def test_tag_push_rc_with_custom_prefix(self, mock_github_api: MagicMock) -> None:
         """Test RC tag push with custom prefix."""
-        mock_github_api.get_branch_commits.return_value = [make_commit("rc_sha")]
+        mock_github_api.branch_commits.return_value = [make_commit("rc_sha")]
 
         context = GitHubContext(
             event_name="push",
@@ -467,7 +512,7 @@ class TestTagPushWithCustomPrefixes:
             make_tag("pkg-1.0.0"),
             make_tag("pkg-1.0.1"),
         ]
-        mock_github_api.get_branch_commits.return_value = [make_commit("patch_sha")]
+        mock_github_api.branch_commits.return_value = [make_commit("patch_sha")]
 
         context = GitHubContext(
             event_name="push",
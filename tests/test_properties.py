@@ -13,7 +13,8 @@ from __future__ import annotations
 from hypothesis import assume, given, settings
 from hypothesis import strategies as st
 
-from src.branch import extract_version, validate_branch
+from src.branch import RELEASE_BRANCH_PATTERN, extract_version, validate_branch
+from tests.conftest import alias_updates, make_mock_api
 
 # Strategy for generating valid major/minor version numbers (SemVer 2.0.0 compliant)
 # - 0 is valid
@@ -185,6 +186,17 @@ class TestBranchPatternValidation:
         # Result should be boolean
         assert isinstance(result, bool), f"Expected boolean result for '{text}', got {type(result)}"
 
+    @settings(max_examples=200)
+    @given(suffix=random_string)
+    def test_validator_agrees_with_pattern(self, suffix: str) -> None:
+        """The string-based validator SHALL accept exactly what the regex accepts.
+
+        **Validates: Requirements 1.1, 1.2**
+        """
+        branch = f"release/v{suffix}"
+        expected = RELEASE_BRANCH_PATTERN.fullmatch(branch) is not None
+        assert validate_branch(branch) is expected, f"Validator disagrees with pattern for '{branch}'"
+
     @settings(max_examples=100)
     @given(branch=valid_release_branch())
     def test_validation_and_extraction_consistency(self, branch: str) -> None:
@@ -225,7 +237,7 @@ class TestRCTagSequencing:
         from src.tags import get_next_rc_tag
 
         # Simulate a mock API that tracks created tags
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         created_tags: list[str] = []
 
         def list_tags_side_effect() -> list[MagicMock]:
@@ -271,7 +283,7 @@ class TestRCTagSequencing:
 
         from src.tags import get_next_rc_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         created_tags: list[str] = []
 
         def list_tags_side_effect() -> list[MagicMock]:
@@ -308,7 +320,7 @@ class TestRCTagSequencing:
 
         from src.tags import get_next_rc_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         created_tags: list[str] = []
 
         def list_tags_side_effect() -> list[MagicMock]:
@@ -349,11 +361,9 @@ class TestRCTagSequencing:
 
         **Validates: Requirements 2.1**
         """
-        from unittest.mock import MagicMock
-
         from src.tags import get_next_rc_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         # Empty tag list - no existing tags
         mock_api.list_tags.return_value = []
 
@@ -393,7 +403,7 @@ class TestPatchTagSequencing:
         from src.tags import get_next_patch_tag
 
         # Simulate a mock API that tracks created tags
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         created_tags: list[str] = []
 
         # Start with GA release (v1.0.0) already existing
@@ -443,7 +453,7 @@ class TestPatchTagSequencing:
 
         from src.tags import get_next_patch_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         created_tags: list[str] = []
 
         # Start with GA release
@@ -483,7 +493,7 @@ class TestPatchTagSequencing:
 
         from src.tags import get_next_patch_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         created_tags: list[str] = []
 
         # Start with GA release
@@ -538,7 +548,7 @@ class TestPatchTagSequencing:
                 if major + minor >= num_commits:
                     break
 
-                mock_api = MagicMock()
+                mock_api = make_mock_api()
                 # Only GA tag exists
                 ga_tag = MagicMock()
                 ga_tag.name = f"v{major}.{minor}.0"
@@ -565,7 +575,7 @@ class TestPatchTagSequencing:
 
         from src.tags import get_next_patch_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # Create existing tags: GA + patches up to existing_patches
         existing_tags = []
@@ -628,7 +638,7 @@ class TestAliasTagCorrectness:
 
         from src.aliases import find_highest_major_version
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # Create mock tags from releases
         tags = []
@@ -660,7 +670,7 @@ class TestAliasTagCorrectness:
 
         from src.aliases import find_highest_minor_version
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # Create mock tags from releases
         tags = []
@@ -688,11 +698,9 @@ class TestAliasTagCorrectness:
 
         **Validates: Requirements 6.4**
         """
-        from unittest.mock import MagicMock
-
         from src.aliases import update_alias_tags
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         mock_api.list_tags.return_value = []
 
         # Test with RC tags - should not update aliases
@@ -723,7 +731,7 @@ class TestAliasTagCorrectness:
 
         from src.aliases import should_update_minor_alias
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # Create tags for all patches in the series
         tags = []
@@ -764,7 +772,7 @@ class TestAliasTagCorrectness:
 
         from src.aliases import find_highest_major_version
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # Create mock tags from releases
         tags = []
@@ -802,7 +810,7 @@ class TestAliasTagCorrectness:
 
         from src.aliases import find_highest_minor_version
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # Create tags for multiple minor series
         tags = []
@@ -882,7 +890,7 @@ class TestManualTagValidation:
 
         from src.main import _validate_tag_on_branch
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # Create mock commit objects for the branch
         mock_commits = []
@@ -890,7 +898,7 @@ class TestManualTagValidation:
             commit = MagicMock()
             commit.sha = sha
             mock_commits.append(commit)
-        mock_api.get_branch_commits.return_value = mock_commits
+        mock_api.branch_commits.return_value = mock_commits
 
         branch_name = f"release/v{major}.{minor}"
 
@@ -924,7 +932,7 @@ class TestManualTagValidation:
         # Ensure the other_commit is not in branch_commits
         assume(other_commit not in branch_commits)
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # Create mock commit objects for the branch
         mock_commits = []
@@ -932,7 +940,7 @@ class TestManualTagValidation:
             commit = MagicMock()
             commit.sha = sha
             mock_commits.append(commit)
-        mock_api.get_branch_commits.return_value = mock_commits
+        mock_api.branch_commits.return_value = mock_commits
 
         branch_name = f"release/v{major}.{minor}"
 
@@ -954,16 +962,17 @@ class TestManualTagValidation:
         """
         from unittest.mock import MagicMock
 
-        from src.main import _parse_tag_version, _validate_tag_on_branch
+        from src.main import _validate_tag_on_branch
+        from src.tags import parse_tag_type
 
         # Parse the tag to get major.minor
-        version = _parse_tag_version(tag_name)
-        assert version is not None, f"Tag {tag_name} should be parseable"
+        parsed = parse_tag_type(tag_name)
+        assert parsed is not None, f"Tag {tag_name} should be parseable"
 
-        major, minor = version
+        major, minor, _ = parsed
         expected_branch = f"release/v{major}.{minor}"
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # Create mock commit objects for the branch
         mock_commits = []
@@ -971,7 +980,7 @@ class TestManualTagValidation:
             commit = MagicMock()
             commit.sha = sha
             mock_commits.append(commit)
-        mock_api.get_branch_commits.return_value = mock_commits
+        mock_api.branch_commits.return_value = mock_commits
 
         # A commit on the correct branch should be accepted
         commit_sha = branch_commits[0]
@@ -988,12 +997,10 @@ class TestManualTagValidation:
 
         **Validates: Requirements 5.2**
         """
-        from unittest.mock import MagicMock
-
         from src.main import _validate_tag_on_branch
 
-        mock_api = MagicMock()
-        mock_api.get_branch_commits.side_effect = Exception("API error")
+        mock_api = make_mock_api()
+        mock_api.branch_commits.side_effect = Exception("API error")
 
         branch_name = f"release/v{major}.{minor}"
         commit_sha = "a" * 40  # Valid SHA format
@@ -1020,7 +1027,7 @@ class TestManualTagValidation:
         from src.main import _validate_tag_on_branch
         from src.tags import is_ga_tag, is_patch_tag, is_rc_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # Create mock commit objects for the branch
         mock_commits = []
@@ -1028,7 +1035,7 @@ class TestManualTagValidation:
             commit = MagicMock()
             commit.sha = sha
             mock_commits.append(commit)
-        mock_api.get_branch_commits.return_value = mock_commits
+        mock_api.branch_commits.return_value = mock_commits
 
         branch_name = f"release/v{major}.{minor}"
 
@@ -1058,12 +1065,10 @@ class TestManualTagValidation:
 
         **Validates: Requirements 5.2**
         """
-        from unittest.mock import MagicMock
-
         from src.main import _validate_tag_on_branch
 
-        mock_api = MagicMock()
-        mock_api.get_branch_commits.return_value = []  # Empty branch
+        mock_api = make_mock_api()
+        mock_api.branch_commits.return_value = []  # Empty branch
 
         branch_name = f"release/v{major}.{minor}"
         commit_sha = "a" * 40  # Any commit SHA
@@ -1100,7 +1105,7 @@ class TestManualTagValidation:
         # Ensure we're checking against a different branch
         assume(major != wrong_major or minor != wrong_minor)
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
 
         # The correct branch has commits
         correct_branch_commits = []
@@ -1110,7 +1115,7 @@ class TestManualTagValidation:
             correct_branch_commits.append(commit)
 
         # The wrong branch has no commits (or different commits)
-        mock_api.get_branch_commits.return_value = []
+        mock_api.branch_commits.return_value = []
 
         wrong_branch = f"release/v{wrong_major}.{wrong_minor}"
         commit_sha = branch_commits[0]
@@ -1540,11 +1545,9 @@ class TestTagPrefixApplication:
 
         **Validates: Requirements 2.3**
         """
-        from unittest.mock import MagicMock
-
         from src.tags import get_next_rc_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         mock_api.list_tags.return_value = []
 
         tag_name = get_next_rc_tag(mock_api, major, minor, tag_prefix)
@@ -1568,7 +1571,7 @@ class TestTagPrefixApplication:
 
         from src.tags import get_next_patch_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         # Simulate GA tag exists
         ga_tag = MagicMock()
         ga_tag.name = f"{tag_prefix}{major}.{minor}.0"
@@ -1596,7 +1599,7 @@ class TestTagPrefixApplication:
 
         from src.aliases import update_alias_tags
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         # Create a release tag
         release_tag = MagicMock()
         release_tag.name = f"{tag_prefix}{major}.{minor}.{patch}"
@@ -1608,17 +1611,13 @@ class TestTagPrefixApplication:
 
         result = update_alias_tags(mock_api, tag_name, commit_sha, tag_prefix=tag_prefix)
 
-        # Check that create_tag was called with correct prefix
+        # Check that the aliases were written with the correct prefix
+        aliases = alias_updates(mock_api)
         if result["major"]:
-            # Find the major alias call
-            calls = mock_api.create_tag.call_args_list
-            major_alias_calls = [c for c in calls if c[0][0] == f"{tag_prefix}{major}"]
-            assert len(major_alias_calls) > 0, f"Major alias should be created with prefix '{tag_prefix}'"
+            assert f"{tag_prefix}{major}" in aliases, f"Major alias should be created with prefix '{tag_prefix}'"
 
         if result["minor"]:
-            calls = mock_api.create_tag.call_args_list
-            minor_alias_calls = [c for c in calls if c[0][0] == f"{tag_prefix}{major}.{minor}"]
-            assert len(minor_alias_calls) > 0, f"Minor alias should be created with prefix '{tag_prefix}'"
+            assert f"{tag_prefix}{major}.{minor}" in aliases, f"Minor alias should be created with prefix '{tag_prefix}'"
 
     @settings(max_examples=100)
     @given(
@@ -1636,7 +1635,7 @@ class TestTagPrefixApplication:
 
         from src.tags import get_next_rc_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         created_tags: list[str] = []
 
         def list_tags_side_effect() -> list[MagicMock]:
@@ -1674,7 +1673,7 @@ class TestTagPrefixApplication:
 
         from src.tags import get_next_patch_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         # Start with GA tag
         created_tags: list[str] = [f"{tag_prefix}{major}.{minor}.0"]
 
@@ -1760,7 +1759,7 @@ class TestAliasSkipLogic:
 
         from src.aliases import update_alias_tags
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         # Create a release tag
         release_tag = MagicMock()
         release_tag.name = f"{prefix}{major}.{minor}.{patch}"
@@ -1795,7 +1794,7 @@ class TestAliasSkipLogic:
 
         from src.aliases import update_alias_tags
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         # Create a release tag
         release_tag = MagicMock()
         release_tag.name = f"{prefix}{major}.{minor}.{patch}"
@@ -1850,7 +1849,7 @@ class TestAliasSkipLogic:
         skip = should_skip_minor_alias(prefix, prefix)
         assert skip is True
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         release_tag = MagicMock()
         release_tag.name = f"{prefix}{major}.{minor}.{patch}"
         mock_api.list_tags.return_value = [release_tag]
@@ -2047,11 +2046,9 @@ class TestBackwardCompatibility:
 
         **Validates: Requirements 8.1**
         """
-        from unittest.mock import MagicMock
-
         from src.tags import get_next_rc_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         mock_api.list_tags.return_value = []
 
         # Using default tag prefix
@@ -2076,7 +2073,7 @@ class TestBackwardCompatibility:
         from src.aliases import update_alias_tags
         from src.branch import should_skip_minor_alias
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         release_tag = MagicMock()
         release_tag.name = f"v{major}.{minor}.{patch}"
         mock_api.list_tags.return_value = [release_tag]
@@ -2096,8 +2093,7 @@ class TestBackwardCompatibility:
         assert result["minor"] is True, "Minor alias should be created"
 
         # Verify the alias names
-        calls = mock_api.create_tag.call_args_list
-        alias_names = [c[0][0] for c in calls]
+        alias_names = alias_updates(mock_api)
 
         assert f"v{major}" in alias_names, f"Major alias 'v{major}' should be created"
         assert f"v{major}.{minor}" in alias_names, f"Minor alias 'v{major}.{minor}' should be created"
@@ -2160,7 +2156,7 @@ class TestBackwardCompatibility:
 
         from src.tags import get_next_rc_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         created_tags: list[str] = []
 
         def list_tags_side_effect() -> list[MagicMock]:
@@ -2195,7 +2191,7 @@ class TestBackwardCompatibility:
 
         from src.tags import get_next_patch_tag
 
-        mock_api = MagicMock()
+        mock_api = make_mock_api()
         # Start with GA tag
         created_tags: list[str] = [f"v{major}.{minor}.0"]
 
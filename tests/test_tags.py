@@ -12,6 +12,11 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 from src.tags import (
+    PATCH_TAG_PATTERN,
+    RC_TAG_PATTERN,
+    classify_tag,
+    create_patch_pattern,
+    create_rc_pattern,
     create_tag,
     find_latest_patch,
     find_latest_rc,
@@ -23,10 +28,26 @@ from src.tags import (
     is_ga_tag,
     is_patch_tag,
     is_rc_tag,
+    parse_tag_type,
 )
 from tests.conftest import make_tag
 
 
+class TestCreatePatterns:
+    """Tests for create_rc_pattern() and create_patch_pattern() helpers."""
+
+    def test_default_prefix_uses_prebuilt_patterns(self) -> None:
+        """Test that the default 'v' prefix skips compilation entirely."""
+        assert create_rc_pattern("v") is RC_TAG_PATTERN
+        assert create_patch_pattern("v") is PATCH_TAG_PATTERN
+
+    def test_custom_prefix_patterns_are_cached(self) -> None:
+        """Test that patterns for other prefixes are compiled once."""
+        assert create_rc_pattern("pkg-v") is create_rc_pattern("pkg-v")
+        assert create_patch_pattern("pkg-v") is create_patch_pattern("pkg-v")
+        assert create_patch_pattern("pkg-v").match("pkg-v1.2.3") is not None
+
+
 class TestFindLatestRc:
     """Tests for find_latest_rc() function."""
 
@@ -81,10 +102,36 @@ class TestFindLatestRc:
         result = find_latest_rc(mock_github_api, 1, 2)
         assert result == 2
 
+    def test_ignores_leading_zero_versions(self, mock_github_api: MagicMock) -> None:
+        """Test that only canonical names are counted in the series."""
+        mock_github_api.list_tags.return_value = [make_tag("v1.2.0-rc1"), make_tag("v01.2.0-rc5")]
+        assert find_latest_rc(mock_github_api, 1, 2) == 1
+        assert find_latest_rc(mock_github_api, 1, 2, tags=mock_github_api.list_tags.return_value) == 1
+
 
 class TestFindLatestPatch:
     """Tests for find_latest_patch() function."""
 
+    def test_uses_provided_tags(self, mock_github_api: MagicMock) -> None:
+        """Test that a caller-supplied listing is scanned instead of the API."""
+        tags = [make_tag("v1.2.0"), make_tag("v1.2.3")]
+        assert find_latest_patch(mock_github_api, 1, 2, tags=tags) == 3
+        assert get_next_rc_tag(mock_github_api, 1, 3, tags=tags) == "v1.3.0-rc1"
+        mock_github_api.iter_tags.assert_not_called()
+        mock_github_api.list_tag_refs.assert_not_called()
+
+    def test_ignores_leading_zero_versions(self, mock_github_api: MagicMock) -> None:
+        """Test that a supplied listing matches the series as the server-side filter does."""
+        tags = [make_tag("v1.2.1"), make_tag("v01.2.9"), make_tag("v1.02.8")]
+        assert find_latest_patch(mock_github_api, 1, 2, tags=tags) == 1
+
+    def test_lists_only_series_tags(self, mock_github_api: MagicMock) -> None:
+        """Test that without a listing only the X.Y. series is requested."""
+        mock_github_api.list_tags.return_value = [make_tag("v1.2.0"), make_tag("v1.2.4"), make_tag("v1.3.7")]
+        assert find_latest_patch(mock_github_api, 1, 2) == 4
+        mock_github_api.list_tag_refs.assert_called_once_with("v1.2.")
+        mock_github_api.iter_tags.assert_not_called()
+
     def test_no_tags_returns_none(self, mock_github_api: MagicMock) -> None:
         """Test that empty tag list returns None."""
         mock_github_api.list_tags.return_value = []
@@ -261,6 +308,56 @@ class TestGetNextPatchTag:
         assert result == "v1.2.3"
 
 
+class TestParseTagType:
+    """Tests for parse_tag_type() function."""
+
+    def test_returns_series_and_type(self) -> None:
+        """Test that the series and release type come from one parse."""
+        assert parse_tag_type("v1.2.0-rc1") == (1, 2, "rc")
+        assert parse_tag_type("v1.2.0") == (1, 2, "ga")
+        assert parse_tag_type("v1.2.3") == (1, 2, "patch")
+
+    def test_non_canonical_numbers_use_patterns(self) -> None:
+        """Test that names outside the string fast path are parsed by the patterns."""
+        assert parse_tag_type("v01.2.0-rc1") == (1, 2, "rc")
+        assert parse_tag_type("pkg-v1.02.4", "pkg-v") == (1, 2, "patch")
+
+    def test_invalid_tag_returns_none(self) -> None:
+        """Test that non-release tags are not parsed."""
+        assert parse_tag_type("v1.2.3-rc1") is None
+        assert parse_tag_type("v\u0661.2.0") is None
+        assert parse_tag_type("release/v1.2") is None
+
+
+class TestClassifyTag:
+    """Tests for classify_tag() function."""
+
+    def test_release_kinds(self) -> None:
+        """Test that RC, GA and patch tags are told apart."""
+        assert classify_tag("v1.2.0-rc1") == "rc"
+        assert classify_tag("v1.2.0") == "ga"
+        assert classify_tag("v1.2.3") == "patch"
+
+    def test_custom_prefix(self) -> None:
+        """Test classification with a custom tag prefix."""
+        assert classify_tag("pkg-v1.2.0-rc2", "pkg-v") == "rc"
+        assert classify_tag("pkg-v1.2.4", "pkg-v") == "patch"
+        assert classify_tag("v1.2.4", "pkg-v") is None
+
+    def test_invalid_tag_returns_none(self) -> None:
+        """Test that non-release tags are not classified."""
+        assert classify_tag("v1.2.3-rc1") is None
+        assert classify_tag("invalid") is None
+        assert classify_tag("") is None
+
+    def test_non_ascii_digits_rejected(self) -> None:
+        """Test that only ASCII digits are accepted, matching parse_release_tag."""
+        assert classify_tag("v\u0661.2.0") is None
+        assert classify_tag("v1.2.0-rc\u0661") is None
+        assert classify_tag("v1.2.3\n") is None
+        assert find_latest_patch(MagicMock(), 1, 2, tags=[make_tag("v1.2.\u0663")]) is None
+
+
 class TestIsRcTag:
     """Tests for is_rc_tag() function."""
 
@@ -282,6 +379,18 @@ class TestIsRcTag:
         assert is_rc_tag("invalid") is False
         assert is_rc_tag("") is False
 
+    def test_rc_suffix_on_patch_tag_returns_false(self) -> None:
+        """Test that an RC suffix only counts on X.Y.0 tags."""
+        assert is_rc_tag("v1.2.3-rc1") is False
+        assert is_patch_tag("v1.2.3-rc1") is False
+
+    def test_non_canonical_numbers_match_pattern(self) -> None:
+        """Test that names outside the fast path still follow the RC pattern."""
+        assert is_rc_tag("v01.2.0-rc1") is True
+        assert is_rc_tag("v1.2.0-rc01") is True
+        assert is_rc_tag("v1.2.00-rc1") is False
+        assert is_ga_tag("v1.2.00") is True
+
 
 class TestIsGaTag:
     """Tests for is_ga_tag() function."""